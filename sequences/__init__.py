@@ -1,31 +1,57 @@
 """sequences
 Contains many of the most famous sequences of the OEIS as Python Functions
-each function returns a list containing terms of the sequence"""
-
-
-import math
-
-
-def check(n: int) -> int:
+each function returns a list containing terms of the sequence, and each
+iter_ function yields the terms of the same sequence one by one, indefinitely"""
+
+
+import heapq
+from array import array
+from collections import deque
+from collections.abc import Iterator
+from itertools import count, pairwise
+
+from . import binomial, conway, digits
+from .cache import CACHE
+from .english import ordinal
+from .factor import divisor_count, divisor_sum, smallest_prime_factor
+from .instrument import INSTRUMENTS
+from .multiplicative import (
+    TABLES, arithmetic_mask, semiprime_mask, sphenic_mask
+)
+from .parallel import scan
+from .primality import is_probable_prime, is_repunit_prime, lucas_lehmer
+from .recurrence import LinearRecurrence
+from .sieve import SIEVE
+from .store import STORE
+from .transform import alternate, interleave, offset, scale, translate
+from .vectorized import baum_sweet_array, figurate, gould_array
+
+
+def check(n: int, name: str = "n") -> int:
     """checks if arg 'n' is a positive int"""
 
     if not isinstance(n, int):
-        raise TypeError ("'n' must be an int")
+        raise TypeError (f"'{name}' must be an int")
     if n <= 0:
-        raise ValueError ("'n' must be a positive integer")
+        raise ValueError (f"'{name}' must be a positive integer")
     return n
 
 
-def isprime(n: int) -> list[int]:
-    """returns True if n is prime"""
+def isprime(n: int) -> bool:
+    """returns True if n is prime
+    numbers below the sieve limit are looked up, larger ones go through
+    deterministic Miller-Rabin below 2⁶⁴ and Baillie-PSW above it"""
+
+    if n < SIEVE.limit:
+        return SIEVE.isprime(n)
+    return is_probable_prime(n)
 
-    if n in range(2, 4):
-        return True
 
-    for i in range(2, int(pow(n, 0.5) + 1)):
-        if not (n % i):
-            return False
-    return True
+def iter_whole() -> Iterator[int]:
+    """yields the Whole Numbers one by one
+    0, 1, 2, 3, 4, ..."""
+
+    return count()
 
 
 def whole(n: int) -> list[int]:
@@ -35,6 +61,13 @@ def whole(n: int) -> list[int]:
     return list(range(check(n)))
 
 
+def iter_natural() -> Iterator[int]:
+    """yields the Natural Numbers one by one
+    1, 2, 3, 4, 5, ..."""
+
+    return count(1)
+
+
 def natural(n: int) -> list[int]:
     """returns the first n Natural Numbers
     1, 2, 3, 4, 5, 6, 7, 8, 9, 10, ..., n"""
@@ -42,6 +75,13 @@ def natural(n: int) -> list[int]:
     return whole(check(n) + 1)[1:]
 
 
+def iter_negative() -> Iterator[int]:
+    """yields the Negative Numbers one by one
+    -1, -2, -3, -4, -5, ..."""
+
+    return count(-1, -1)
+
+
 def negative(n: int) -> list[int]:
     """returns the first n Negative Numbers
     -1, -2, -3, -4, -5, -6, -7, -8, -9, -10, ..., -n"""
@@ -49,6 +89,13 @@ def negative(n: int) -> list[int]:
     return [-i for i in natural(n)]
 
 
+def iter_square() -> Iterator[int]:
+    """yields the Perfect Squares one by one
+    0, 1, 4, 9, 16, ..."""
+
+    return (pow(i, 2) for i in count())
+
+
 def square(n: int) -> list[int]:
     """returns the first n Perfect Squares
     0, 1, 4, 9, 16, 25, 36, 49, 64, 81, ..., n²"""
@@ -56,6 +103,13 @@ def square(n: int) -> list[int]:
     return [pow(i, 2) for i in whole(n)]
 
 
+def iter_cube() -> Iterator[int]:
+    """yields the Perfect Cubes one by one
+    0, 1, 8, 27, 64, ..."""
+
+    return (pow(i, 3) for i in count())
+
+
 def cube(n: int) -> list[int]:
     """returns the first n Perfect Cubes
     0, 1, 8, 27, 64, 125, 216, 343, 512, 729, ..., n³"""
@@ -63,68 +117,91 @@ def cube(n: int) -> list[int]:
     return [pow(i, 3) for i in whole(n)]
 
 
+def iter_prime() -> Iterator[int]:
+    """yields the Prime Numbers one by one
+    2, 3, 5, 7, 11, ..."""
+
+    return iter(SIEVE)
+
+
 def prime(n: int) -> list[int]:
     """returns the first n Prime Numbers
     2, 3, 5, 7, 11, 13, 17, 19, 23, 29, ..."""
 
-    n, numbers, num = check(n), [2], 3
+    return STORE.fetch("prime", check(n), SIEVE.first)
+
+
+def iter_composite() -> Iterator[int]:
+    """yields the Composite Numbers one by one
+    4, 6, 8, 9, 10, ..."""
+
+    for p, q in pairwise(SIEVE):
+        yield from range(p+1, q)
 
-    while len(numbers) < n:
-        if num % 2:
-            for i in range(3, int(num**0.5)+1):
-                if not (num % i):
-                    break
-            else:
-                numbers.append(num)
-        num += 1
 
-    return numbers
+def is_composite(x: int) -> bool:
+    """returns True if x is a Composite Number"""
 
+    return x > 3 and not isprime(x)
 
-def composite(n: int) -> list[int]:
+
+def composite(n: int, workers: int | None = None) -> list[int]:
     """returns the first n Composite Numbers
-    4, 6, 8, 9, 10, 12, 14, 15, 16, 18, ..."""
+    4, 6, 8, 9, 10, 12, 14, 15, 16, 18, ...
+    workers: number of processes searching in parallel, one by default"""
 
-    n, numbers, num = check(n), [4], 6
+    if workers is not None:
+        return scan(is_composite, check(n), 4, check(workers, "workers"))
+    return CACHE.get("composite", check(n), iter_composite)
 
-    while len(numbers) < n:
-        for i in range(2, int(num**0.5)+1):
-            if not (num % i):
-                numbers.append(num)
-                break
-        num += 1
 
-    return numbers
+def iter_factorial() -> Iterator[int]:
+    """yields the Factorial Numbers one by one
+    1, 1, 2, 6, 24, ..."""
+
+    num = 1
+    for i in count(1):
+        yield num
+        num *= i
 
 
 def factorial(n: int) -> list[int]:
     """returns the first n Factorial Numbers
     n! = n(n-1)(n-2)...3•2•1"""
 
-    n, numbers = check(n), [1, 1]
+    return CACHE.get("factorial", check(n), iter_factorial)
+
 
-    if n in range(1, 3):
-        return numbers[:n]
+def iter_palindrome() -> Iterator[int]:
+    """yields the Palindrome Numbers one by one
+    0, 1, 2, ..., 9, 11, 22, ..."""
 
-    for i in range(2, n):
-        numbers.append(i * numbers[-1])
+    return digits.palindromes()
 
-    return numbers
 
+def is_palindrome(x: int) -> bool:
+    """returns True if x is a Palindrome Number"""
 
-def palindrome(n: int) -> list[int]:
+    return str(x) == str(x)[::-1]
+
+
+def palindrome(n: int, workers: int | None = None) -> list[int]:
     """returns the first n Palindrome Numbers
     Palindrome Number:
-        a number that remains the same when its digits are reversed"""
+        a number that remains the same when its digits are reversed
+    workers: accepted for compatibility but unused, the terms are built
+        digit by digit rather than searched for"""
+
+    if workers is not None:
+        check(workers, "workers")
+    return CACHE.get("palindrome", check(n), iter_palindrome)
 
-    n, numbers, num = check(n), list(), 0
 
-    while len(numbers) < n:
-        if str(num) == str(num)[::-1]:
-            numbers.append(num)
-        num += 1
+def iter_triangular() -> Iterator[int]:
+    """yields the terms of the Triangular Number Sequence one by one
+    1, 3, 6, 10, 15, ..."""
 
-    return numbers
+    return (i * (i+1) // 2 for i in count(1))
 
 
 def triangular(n: int) -> list[int]:
@@ -132,18 +209,32 @@ def triangular(n: int) -> list[int]:
     Triangular Number:
         the count of circles arranged in an equilateral triangle with n circles
         on a side
-        Tₙ = sum(natural(n))"""
+        Tₙ = sum(natural(n)) = n(n + 1) / 2"""
+
+    return [i * (i+1) // 2 for i in natural(n)]
+
 
-    return [sum(natural(i)) for i in natural(n)]
+def iter_tetrahedral() -> Iterator[int]:
+    """yields the terms of the Tetrahedral Number Sequence one by one
+    1, 4, 10, 20, 35, ..."""
+
+    return (i * (i+1) * (i+2) // 6 for i in count(1))
 
 
 def tetrahedral(n: int) -> list[int]:
     """returns the first n terms of the Tetrahedral Number Sequence
     Tetrahedral Number:
         the count of spheres arranged in a tetrahedron with n spheres on a side
-        Tₙ = sum(triangular(n))"""
+        Tₙ = sum(triangular(n)) = n(n + 1)(n + 2) / 6"""
+
+    return [i * (i+1) * (i+2) // 6 for i in natural(n)]
+
+
+def iter_octahedral() -> Iterator[int]:
+    """yields the terms of the Octahedral Number Sequence one by one
+    1, 6, 19, 44, 85, ..."""
 
-    return [sum(triangular(i)) for i in natural(n)]
+    return (i * (2*pow(i, 2) + 1) // 3 for i in count(1))
 
 
 def octahedral(n: int) -> list[int]:
@@ -155,6 +246,13 @@ def octahedral(n: int) -> list[int]:
     return [i * (2*pow(i, 2) + 1) // 3 for i in natural(n)]
 
 
+def iter_dodecahedral() -> Iterator[int]:
+    """yields the terms of the Dodecahedral Number Sequence one by one
+    1, 20, 84, 220, 455, ..."""
+
+    return (i * (3*i - 1) * (3*i - 2) // 2 for i in count(1))
+
+
 def dodecahedral(n: int) -> list[int]:
     """returns the first n terms of the Dodecahedral Number Sequence
     Dodecahedral Number:
@@ -164,6 +262,13 @@ def dodecahedral(n: int) -> list[int]:
     return [i * (3*i - 1) * (3*i - 2) // 2 for i in natural(n)]
 
 
+def iter_icosahedral() -> Iterator[int]:
+    """yields the terms of the Icosahedral Number Sequence one by one
+    1, 12, 48, 124, 255, ..."""
+
+    return (i * (5 * pow(i, 2) - 5*i + 2) // 2 for i in count(1))
+
+
 def icosahedral(n: int) -> list[int]:
     """returns the first n terms of the Icosahedral Number Sequence
     Icosahedral Number:
@@ -173,14 +278,28 @@ def icosahedral(n: int) -> list[int]:
     return [i * (5 * pow(i, 2) - 5*i + 2) // 2 for i in natural(n)]
 
 
+def iter_sq_pyramid() -> Iterator[int]:
+    """yields the terms of the Square-Pyramidal Number Sequence one by one
+    1, 5, 14, 30, 55, ..."""
+
+    return (i * (i+1) * (2*i + 1) // 6 for i in count(1))
+
+
 def sq_pyramid(n: int) -> list[int]:
     """returns the first n terms of the Square-Pyramidal Number Sequence
     Square-Pyramidal Number:
         the count of spheres arranged in a square pyramid with n spheres on a
         side of the square base
-        Pₙ = sum(square(n + 1))"""
+        Pₙ = sum(square(n + 1)) = n(n + 1)(2n + 1) / 6"""
+
+    return [i * (i+1) * (2*i + 1) // 6 for i in natural(n)]
 
-    return [sum(square(i + 1)) for i in natural(n)]
+
+def iter_star() -> Iterator[int]:
+    """yields the terms of the Star Number Sequence one by one
+    1, 13, 37, 73, 121, ..."""
+
+    return ((6 * i * (i-1)) + 1 for i in count(1))
 
 
 def star(n: int) -> list[int]:
@@ -193,6 +312,13 @@ def star(n: int) -> list[int]:
     return [(6 * i * (i-1)) + 1 for i in natural(n)]
 
 
+def iter_stella_octangula() -> Iterator[int]:
+    """yields the terms of the Stella-Octangula Number Sequence one by one
+    0, 1, 14, 51, 124, ..."""
+
+    return (i * ((2 * pow(i, 2)) - 1) for i in count())
+
+
 def stella_octangula(n: int) -> list[int]:
     """returns the first n terms of the Stella-Octangula Number Sequence
     Stella-Octangula Number:
@@ -203,6 +329,13 @@ def stella_octangula(n: int) -> list[int]:
     return [i * ((2 * pow(i, 2)) - 1) for i in whole(n)]
 
 
+def iter_central_polygon() -> Iterator[int]:
+    """yields the terms of the Central Polygon Number Sequence one by one
+    1, 2, 4, 7, 11, ..."""
+
+    return ((pow(i, 2) + i+2) // 2 for i in count())
+
+
 def central_polygon(n: int) -> list[int]:
     """returns the first n terms of the Central Polygon Number Sequence
     Central Polygon Number:
@@ -213,6 +346,13 @@ def central_polygon(n: int) -> list[int]:
     return [(pow(n, 2) + n+2) // 2 for n in whole(n)]
 
 
+def iter_magic_constants() -> Iterator[int]:
+    """yields the Magic Constants one by one
+    0, 1, 5, 15, 34, ..."""
+
+    return (i * (pow(i, 2)+1) // 2 for i in count())
+
+
 def magic_constants(n: int) -> list[int]:
     """returns the first n Magic Constants
     Magic Constant:
@@ -221,6 +361,13 @@ def magic_constants(n: int) -> list[int]:
     return [i * (pow(i, 2)+1) // 2 for i in whole(n)]
 
 
+def iter_woodall() -> Iterator[int]:
+    """yields the terms of the Woodall Number Sequence one by one
+    1, 7, 23, 63, 159, ..."""
+
+    return ((i * pow(2, i)) - 1 for i in count(1))
+
+
 def woodall(n: int) -> list[int]:
     """returns the first n terms of the Woodall Number Sequence
     Woodall Number:
@@ -230,6 +377,13 @@ def woodall(n: int) -> list[int]:
     return [(i * pow(2, i)) - 1 for i in natural(n)]
 
 
+def iter_cullen() -> Iterator[int]:
+    """yields the terms of the Cullen Number Sequence one by one
+    1, 3, 9, 25, 65, ..."""
+
+    return ((i * pow(2, i)) + 1 for i in count())
+
+
 def cullen(n: int) -> list[int]:
     """returns the first n terms of the Cullen Number Sequence
     Cullen Number:
@@ -239,6 +393,13 @@ def cullen(n: int) -> list[int]:
     return [(i * pow(2, i)) + 1 for i in whole(n)]
 
 
+def iter_pronic() -> Iterator[int]:
+    """yields the terms of the Pronic Number Sequence one by one
+    0, 2, 6, 12, 20, ..."""
+
+    return (i * (i+1) for i in count())
+
+
 def pronic(n: int) -> list[int]:
     """returns the first n terms of the Pronic Number Sequence
     Pronic Number:
@@ -248,29 +409,38 @@ def pronic(n: int) -> list[int]:
     return [i * (i+1) for i in whole(n)]
 
 
-def arithmetic(n: int) -> list[int]:
+def iter_arithmetic() -> Iterator[int]:
+    """yields the terms of the Arithmetic Number Sequence one by one
+    1, 3, 5, 6, 7, ..."""
+
+    return TABLES.iterate(arithmetic_mask)
+
+
+def is_arithmetic(x: int) -> bool:
+    """returns True if x is an Arithmetic Number"""
+
+    return x > 0 and not (divisor_sum(x) % divisor_count(x))
+
+
+def arithmetic(n: int, workers: int | None = None) -> list[int]:
     """returns the first n terms of the Arithmetic Number Sequence
     Arithmetic Number:
         a number such that the average of its positive divisors is also an
-        integer"""
-
-    n, numbers, num = check(n), list(), 1
+        integer
+    workers: number of processes searching in parallel, one by default"""
 
-    def average(x):
-        """returns the average of the positive divisors of x"""
+    if workers is not None:
+        return scan(is_arithmetic, check(n), 1, check(workers, "workers"))
+    return STORE.fetch("arithmetic", check(n), lambda n: TABLES.select(
+        n, arithmetic_mask, estimate=2*n + 64
+    ))
 
-        divisors = list()
-        for i in range(1, x+1):
-            if not (x % i):
-                divisors.append(i)
-        return float(sum(divisors) / len(divisors))
 
-    while len(numbers) < n:
-        if average(num).is_integer():
-            numbers.append(num)
-        num += 1
+def iter_carol() -> Iterator[int]:
+    """yields the terms of the Carol Number Sequence one by one
+    -1, 7, 47, 223, 959, ..."""
 
-    return numbers
+    return (pow(4, i) - pow(2, i+1) - 1 for i in count(1))
 
 
 def carol(n: int) -> list[int]:
@@ -282,69 +452,132 @@ def carol(n: int) -> list[int]:
     return [pow(4, i) - pow(2, i+1) - 1 for i in natural(n)]
 
 
-def perfect(n: int) -> list[int]:
+def iter_perfect() -> Iterator[int]:
+    """yields the terms of the Perfect Number Sequence one by one
+    6, 28, 496, 8128, ...
+    each term is yielded as soon as its Mersenne prime is confirmed"""
+
+    return map(euclid_euler, filter(lucas_lehmer, SIEVE))
+
+
+def euclid_euler(p: int) -> int:
+    """returns the even Perfect Number 2ᵖ⁻¹(2ᵖ - 1) built on the Mersenne
+    prime 2ᵖ - 1"""
+
+    return (1 << p-1) * ((1 << p) - 1)
+
+
+def is_mersenne_exponent(x: int) -> bool:
+    """returns True if 2ˣ - 1 is a Mersenne prime"""
+
+    return isprime(x) and lucas_lehmer(x)
+
+
+def perfect(n: int, workers: int | None = None) -> list[int]:
     """returns the first n terms of the Perfect Number Sequence
     Perfect Number:
         number that is equal to sum of its positive divisors excluding itself
-        example: 6 = 3 + 2 + 1"""
+        example: 6 = 3 + 2 + 1
+    the terms are built as 2ᵖ⁻¹(2ᵖ - 1) (Euclid-Euler) from the Mersenne primes
+    2ᵖ - 1, found by the Lucas-Lehmer test; no odd Perfect Number is known
+    workers: number of processes testing Mersenne numbers in parallel, one by
+    default"""
 
-    n, numbers = check(n), list()
+    if workers is not None:
+        # the Lucas-Lehmer tests get costlier, so the blocks stay short
+        exponents = scan(
+            is_mersenne_exponent, check(n), 2, check(workers, "workers"), 8, 8
+        )
+        return list(map(euclid_euler, exponents))
+    return STORE.fetch("perfect", check(n), lambda n: CACHE.get(
+        "perfect", n, iter_perfect
+    ))
 
-    def divisors(x):
-        """returns the sum of positive divisors of x"""
-        return sum(i for i in range(1, x) if not (x % i))
 
-    num = 1
-    while len(numbers) < n:
-        if divisors(num) == num:
-            numbers.append(num)
-        num += 1
+def iter_undulating() -> Iterator[int]:
+    """yields the terms of the Undulating Number Sequence one by one
+    101, 121, 131, 141, 151, ..."""
 
-    return numbers
+    return digits.undulatings()
 
 
-def undulating(n: int) -> list[int]:
-    """returns the first n terms of the Undulating Number Sequence
-    Undulating Number:
-        number of the form ABABAB... (A ≠ B)"""
+def is_undulating(x: int) -> bool:
+    """returns True if x is an Undulating Number"""
 
-    n, numbers, num = check(n), list(), 100
+    if x < 100:
+        return False
+    a, b  = str(x)[::2], str(x)[1::2]
+    types = (a == a[0]*len(a)) and (b == b[0]*len(b))
+    return types and (a[0] != b[0])
 
-    while len(numbers) < n:
-        a, b  = str(num)[::2], str(num)[1::2]
-        types = (a == a[0]*len(a)) and (b == b[0]*len(b))
 
-        if types and (a[0] != b[0]):
-            numbers.append(num)
-        num += 1
+def undulating(n: int, workers: int | None = None) -> list[int]:
+    """returns the first n terms of the Undulating Number Sequence
+    Undulating Number:
+        number of the form ABABAB... (A ≠ B)
+    workers: accepted for compatibility but unused, the terms are built
+        digit by digit rather than searched for"""
+
+    if workers is not None:
+        check(workers, "workers")
+    return CACHE.get("undulating", check(n), iter_undulating)
+
+
+def iter_pascal(
+    n: int, start: int = 0, stop: int | None = None,
+    modulus: int | None = None,
+) -> Iterator[int]:
+    """yields the n-th row of the Pascal's triangle one by one, or only its
+    slice [start, stop), reduced modulo the prime 'modulus' if given"""
+
+    if not isinstance(n, int) or not isinstance(start, int):
+        raise TypeError ("'n' and 'start' must be ints")
+    if start < 0:
+        raise ValueError ("'start' must be a non-negative integer")
+    if modulus is None:
+        return binomial.row(n, start, stop)
+    if not isinstance(modulus, int) or not is_probable_prime(modulus):
+        raise ValueError ("'modulus' must be a prime")
+    return binomial.row_mod(n, modulus, start, stop)
+
+
+def pascal(
+    n: int, start: int = 0, stop: int | None = None,
+    modulus: int | None = None,
+) -> list[int]:
+    """returns the n-th row of the Pascal's triangle
+    n-th row of Pascal's Triangle is given by:
+        Pₙ = ⁿCᵣ for r ∈ range(n+1)
+    the row can be restricted to r ∈ range(start, stop), and reduced modulo
+    a prime 'modulus' by Lucas' theorem"""
 
-    return numbers
+    if (start, stop, modulus) == (0, None, None) and isinstance(n, int):
+        # the row is symmetric, only its first half is computed
+        return binomial.full_row(n) if n >= 0 else list()
+    return list(iter_pascal(n, start, stop, modulus))
 
 
-def pascal(n: int) -> list[int]:
-    """returns the n-th row of the Pascal's triangle
-    n-th row of Pascal's Triangle is given by:
-        Pₙ = ⁿCᵣ for r ∈ range(n+1)"""
+def iter_gould() -> Iterator[int]:
+    """yields the terms of the Gould Sequence one by one
+    2, 2, 4, 2, 4, ..."""
 
-    return [math.comb(n, r) for r in range(n+1)]
+    return (1 << i.bit_count() for i in count(1))
 
 
 def gould(n: int) -> list[int]:
     """returns the first n terms of the Gould Sequence
     Gould Number:
         the count of odd numbers in the n-th row of pascal's triangle
-        Tₙ = count(odd numbers in pascal(n))"""
+        Tₙ = count(odd numbers in pascal(n)) = 2^popcount(n)"""
 
-    n, numbers = check(n), list()
+    return CACHE.get("gould", check(n), iter_gould)
 
-    for i in natural(n):
-        count = 0
-        for num in pascal(i):
-            if num % 2:
-                count += 1
-        numbers.append(count)
 
-    return numbers
+def iter_central_binomial() -> Iterator[int]:
+    """yields the Central Binomial Coefficients one by one
+    1, 2, 6, 20, 70, ..."""
+
+    return binomial.central()
 
 
 def central_binomial(n: int) -> list[int]:
@@ -353,7 +586,14 @@ def central_binomial(n: int) -> list[int]:
         the coefficient that shows up exactly in the middle of the even numbered
         rows of Pascal's triangle"""
 
-    return [math.comb(2*i, i) for i in whole(n)]
+    return CACHE.get("central_binomial", check(n), iter_central_binomial)
+
+
+def iter_catalan() -> Iterator[int]:
+    """yields the terms of the Catalan Number Sequence one by one
+    1, 1, 2, 5, 14, ..."""
+
+    return binomial.catalan()
 
 
 def catalan(n: int) -> list[int]:
@@ -362,7 +602,22 @@ def catalan(n: int) -> list[int]:
         number of the form (2n!) / (n!(n+1)!)
         Cₙ = ²ⁿCₙ / (n+1)"""
 
-    return [math.comb(2*i, i) // (i+1) for i in whole(n)]
+    return CACHE.get("catalan", check(n), iter_catalan)
+
+
+def iter_van_eck() -> Iterator[int]:
+    """yields the terms of the Van-Eck Sequence one by one
+    0, 0, 1, 0, 2, ..."""
+
+    # last[x] is 1 + the index at which x last occurred, 0 if it never did
+    # every term is smaller than its index, so the table stays O(n)
+    last, num = array("Q"), 0
+    for index in count(1):
+        yield num
+        if num >= len(last):
+            last.frombytes(bytes(last.itemsize * (num + 1)))
+        seen, last[num] = last[num], index
+        num = index - seen if seen else 0
 
 
 def van_eck(n: int) -> list[int]:
@@ -372,25 +627,22 @@ def van_eck(n: int) -> list[int]:
         Tₙ = 0 if Tₙ₋₁ is a new number
         Tₙ = x if Tₙ occured x steps earlier in the sequence"""
 
-    n, numbers = check(n), [0]
-
-    while len(numbers) < n:
-        num, previous = numbers[-1], numbers[:-1]
-
-        if num not in previous:
-            numbers.append(0)
-            continue
+    return CACHE.get("van_eck", check(n), iter_van_eck)
 
-        count = 0
-        for index in range(len(numbers)-1, -1, -1):
-            if numbers[index] == num:
-                count += 1
-            if count == 2:
-                break
 
-        numbers.append(len(numbers) - 1 - index)
+def iter_recaman() -> Iterator[int]:
+    """yields the terms of the Recamán Sequence one by one
+    0, 1, 3, 6, 2, ..."""
 
-    return numbers
+    # seen[x] is 1 if x already occurred, the bitmap doubles when outgrown
+    num, seen = 0, bytearray(1024)
+    seen[0] = 1
+    for i in count(1):
+        yield num
+        num = num - i if num > i and not seen[num - i] else num + i
+        if num >= len(seen):
+            seen.extend(bytes(len(seen)))
+        seen[num] = 1
 
 
 def recaman(n: int) -> list[int]:
@@ -400,44 +652,69 @@ def recaman(n: int) -> list[int]:
         Tₙ = Tₙ₋₁ - n if positive and not already in sequence
         Tₙ = Tₙ₋₁ + n otherwise"""
 
-    n, numbers = check(n), [0]
+    return CACHE.get("recaman", check(n), iter_recaman)
 
-    for i in range(1, n):
-        num = numbers[-1] - i
-        if num > 0 and num not in numbers:
-            numbers.append(numbers[-1] - i)
-        else:
-            numbers.append(numbers[-1] + i)
 
-    return numbers
+def iter_look_say(kind: type = int) -> Iterator[int | str | bytes]:
+    """yields the terms of the Look and Say Sequence one by one
+    1, 11, 21, 1211, 111221, ...
+    'kind' is int, str or bytes: terms past the 30th are too long to be
+    converted to int, but can be had as digit strings"""
 
+    if kind not in (int, str, bytes):
+        raise ValueError ("'kind' must be one of int, str, bytes")
+    if kind is str:
+        return map(bytes.decode, conway.terms())
+    return map(kind, conway.terms())
 
-def look_say(n: int) -> list[int]:
+
+def look_say(n: int, kind: type = int) -> list[int | str | bytes]:
     """returns first n terms of the Look and Say Sequence
     Look and Say Sequence is defined as:
         Tₙ = 0 if n == 0
         Tₙ = int(word for Tₙ₋₁) otherwise
         example:
             word for: 1 -> 'one 1' -> next term: 11
-            word for: 11233 -> 'two 1s one 2 two 3s' -> next term: 211223"""
+            word for: 11233 -> 'two 1s one 2 two 3s' -> next term: 211223
+    'kind' is int, str or bytes, the type of the terms returned"""
+
+    return CACHE.get(("look_say", kind), check(n), lambda: iter_look_say(kind))
+
+
+def iter_look_say_lengths() -> Iterator[int]:
+    """yields the lengths of the terms of the Look and Say Sequence one by one
+    1, 2, 2, 4, 6, ..."""
+
+    return conway.lengths()
+
 
-    n, numbers = check(n), [1]
+def look_say_lengths(n: int) -> list[int]:
+    """returns the lengths of the first n terms of the Look and Say Sequence
+    computed from the counts of Conway's elements in each term, without
+    building the terms themselves"""
 
-    while len(numbers) < n:
-        num, string = str(numbers[-1]), ""
+    return CACHE.get("look_say_lengths", check(n), iter_look_say_lengths)
 
-        for i in range(len(num)):
-            string += num[i]
-            if i != (len(num) - 1) and num[i] != num[i+1]:
-                string += " "
 
-        chars, string = string.split(), ""
-        for i in chars:
-            string += str(i.count(i[0])) + i[0]
+def iter_aronson() -> Iterator[int]:
+    """yields the terms of the Aronson Sequence one by one
+    1, 4, 11, 16, 24, ..."""
 
-        numbers.append(int(string))
+    # only the length of the sentence and the positions of its unread t's
+    # are kept, the sentence itself is never rescanned
+    sentence = "tisthefirstfourth"
+    length = len(sentence)
+    positions = deque(j for j, char in enumerate(sentence, 1) if char == "t")
 
-    return numbers
+    while True:
+        i = positions.popleft()
+        yield i
+        if i > 4:
+            name = ordinal(i)
+            positions.extend(
+                length + j for j, char in enumerate(name, 1) if char == "t"
+            )
+            length += len(name)
 
 
 def aronson(n: int) -> list[int]:
@@ -447,48 +724,26 @@ def aronson(n: int) -> list[int]:
         "T is the first, fourth, eleventh, ... letter in this sentence"
         ignoring spaces and punctuation marks"""
 
-    sentence = "_tisthefirstfourth"
-    n, numbers = check(n), list()
+    return STORE.fetch("aronson", check(n), lambda n: CACHE.get(
+        "aronson", n, iter_aronson
+    ))
 
-    def name(number):
-        """returns the name of an integer"""
 
-        names = {
-            0: "zero", 1: "first", 2: "second", 3: "third", 4: "fourth",
-            5: "fifth", 6: "sixth", 7: "seventh", 8: "eighth", 9: "ninth",
-            11: "eleventh", 12: "twelfth", 13: "thirteenth", 14: "fourteenth",
-            15: "fifteenth", 16: "sixteenth", 17: "seventeenth", 10: "ten",
-            18: "eighteenth", 19: "nineteenth", 30: "thirty", 40: "forty",
-            20: "twenty",  50: "fifty", 60: "sixty", 70: "seventy",
-            80: "eighty", 90: "ninety",
-        }
-        orders = {
-            **dict.fromkeys([3], ("hundred", 10**2)),
-            **dict.fromkeys([4, 5, 6], ("thousand", 10**3)),
-            **dict.fromkeys([7, 8, 9], ("million", 10**6)),
-            **dict.fromkeys([10, 11, 12], ("billion", 10**9)),
-            **dict.fromkeys([13, 14, 15], ("trillion", 10**12)),
-        }
+def iter_baum_sweet() -> Iterator[int]:
+    """yields the terms of the Baum-Sweet Sequence one by one
+    1, 1, 0, 1, 1, ..."""
 
-        order = len(str(number))
-
-        if number in names:
-            return names[number]
-        if order == 2:
-            return f"{name(number // 10*10)}{name(number % 10)}"
-        place, div = orders[order]
-        slash, percent = number // div, number % div
-        if not percent:
-            return f"{name(slash)}{place}"
-        return f"{name(slash)}{place}{name(percent)}"
-
-    while len(numbers) < n:
-        i = sentence.index("t")
-        numbers.append(i)
-        sentence = sentence.replace("t", "_", 1)
-        if i > 4:
-            sentence += name(i)
-    return numbers
+    yield 1
+    for num in count(1):
+        # strip bin(num) one block at a time from the right, trailing 0s then
+        # trailing 1s, until an odd block of 0s is met or nothing is left
+        while num:
+            zeros = (num & -num).bit_length() - 1
+            if zeros % 2:
+                break
+            num >>= zeros
+            num >>= (num ^ (num+1)).bit_length() - 1
+        yield 0 if num else 1
 
 
 def baum_sweet(n: int) -> list[int]:
@@ -497,26 +752,34 @@ def baum_sweet(n: int) -> list[int]:
         Tₙ = 1 if bin(n) contains no block of consecutive 0s of odd length
         Tₙ = 0 otherwise"""
 
-    n, numbers, num = check(n), [1], 1
+    return CACHE.get("baum_sweet", check(n), iter_baum_sweet)
 
-    while len(numbers) < n:
-        binary, string = bin(num), ""
 
-        for i in range(len(binary)):
-            string += binary[i]
-            if i != (len(binary) - 1) and binary[i] != binary[i+1]:
-                string += " "
+# the linear recurrences of the module, whose iter_ generators start from the
+# initial terms given here, and whose single terms nth() computes
+RECURRENCES = {
+    "fibonacci": LinearRecurrence((1, 1), (0, 1)),
+    "negafibonacci": LinearRecurrence((-1, 1), (0, 1)),
+    "tribonacci": LinearRecurrence((1, 1, 1), (0, 0, 1)),
+    "negatribonacci": LinearRecurrence((-1, 1, -1), (0, 0, -1)),
+    "lucas": LinearRecurrence((1, 1), (2, 1)),
+    "negalucas": LinearRecurrence((-1, 1), (2, -1)),
+    "supergolden": LinearRecurrence((1, 0, 1), (1, 1, 1)),
+    "padovan": LinearRecurrence((0, 1, 1), (1, 1, 1)),
+    "perrin": LinearRecurrence((0, 1, 1), (3, 0, 2)),
+    "pell": LinearRecurrence((2, 1), (0, 1)),
+    "jacobstathal": LinearRecurrence((1, 2), (0, 1)),
+}
 
-        for char in string[3:].split():
-            if char[0] == "0" and (len(char) % 2):
-                numbers.append(0)
-                break
-        else:
-            numbers.append(1)
 
-        num += 1
+def iter_fibonacci() -> Iterator[int]:
+    """yields the terms of the Fibonacci Sequence one by one
+    0, 1, 1, 2, 3, ..."""
 
-    return numbers
+    a, b = RECURRENCES["fibonacci"].initial
+    while True:
+        yield a
+        a, b = b, a + b
 
 
 def fibonacci(n: int) -> list[int]:
@@ -526,15 +789,14 @@ def fibonacci(n: int) -> list[int]:
         Fₙ = 1 if n == 1
         Fₙ = Fₙ₋₁ + Fₙ₋₂ otherwise"""
 
-    n, numbers = check(n), [0, 1]
+    return CACHE.get("fibonacci", check(n), iter_fibonacci)
 
-    if n in range(1, 3):
-        return numbers[:n]
 
-    while len(numbers) < n:
-        numbers.append(numbers[-1] + numbers[-2])
+def iter_negafibonacci() -> Iterator[int]:
+    """yields the terms of the NegaFibonacci Sequence one by one
+    0, 1, -1, 2, -3, ..."""
 
-    return numbers
+    return alternate(iter_fibonacci(), -1)
 
 
 def negafibonacci(n: int) -> list[int]:
@@ -543,7 +805,17 @@ def negafibonacci(n: int) -> list[int]:
         F₋ₙ = (-1)ⁿ⁺¹Fₙ
         where Fₙ is the n-th Fibonacci Number"""
 
-    return [pow(-1, i+1) * fibonacci(n)[i] for i in range(n)]
+    return CACHE.get("negafibonacci", check(n), iter_negafibonacci)
+
+
+def iter_tribonacci() -> Iterator[int]:
+    """yields the terms of the Tribonacci Sequence one by one
+    0, 0, 1, 1, 2, ..."""
+
+    a, b, c = RECURRENCES["tribonacci"].initial
+    while True:
+        yield a
+        a, b, c = b, c, a + b + c
 
 
 def tribonacci(n: int) -> list[int]:
@@ -553,15 +825,14 @@ def tribonacci(n: int) -> list[int]:
         Tₙ = 1 if n == 2
         Tₙ = Tₙ₋₁ + Tₙ₋₂ + Tₙ₋₃ otherwise"""
 
-    n, numbers = check(n), [0, 0, 1]
+    return CACHE.get("tribonacci", check(n), iter_tribonacci)
 
-    if n in range(1, 4):
-        return numbers[:n]
 
-    while len(numbers) < n:
-        numbers.append(sum(numbers[-3:]))
+def iter_negatribonacci() -> Iterator[int]:
+    """yields the terms of the NegaTribonacci Sequence one by one
+    0, 0, -1, 1, -2, ..."""
 
-    return numbers
+    return alternate(iter_tribonacci(), -1)
 
 
 def negatribonacci(n: int) -> list[int]:
@@ -570,7 +841,17 @@ def negatribonacci(n: int) -> list[int]:
         T₋ₙ = (-1)ⁿ⁺¹Tₙ
         where Tₙ is the n-th Tribonacci Number"""
 
-    return [pow(-1, i+1) * tribonacci(n)[i] for i in range(n)]
+    return CACHE.get("negatribonacci", check(n), iter_negatribonacci)
+
+
+def iter_lucas() -> Iterator[int]:
+    """yields the terms of the Lucas Sequence one by one
+    2, 1, 3, 4, 7, ..."""
+
+    a, b = RECURRENCES["lucas"].initial
+    while True:
+        yield a
+        a, b = b, a + b
 
 
 def lucas(n: int) -> list[int]:
@@ -580,15 +861,14 @@ def lucas(n: int) -> list[int]:
         Lₙ = 1 if n == 1
         Lₙ = Lₙ₋₁ + Lₙ₋₂ otherwise"""
 
-    n, numbers = check(n), [2, 1]
+    return CACHE.get("lucas", check(n), iter_lucas)
 
-    if n in range(1, 3):
-        return numbers[:n]
 
-    while len(numbers) < n:
-        numbers.append(numbers[-1] + numbers[-2])
+def iter_negalucas() -> Iterator[int]:
+    """yields the terms of the NegaLucas Sequence one by one
+    2, -1, 3, -4, 7, ..."""
 
-    return numbers
+    return alternate(iter_lucas())
 
 
 def negalucas(n: int) -> list[int]:
@@ -597,7 +877,17 @@ def negalucas(n: int) -> list[int]:
         L₋ₙ = (-1)ⁿLₙ
         where Lₙ is the n-th Lucas Number"""
 
-    return [pow(-1, i) * lucas(n)[i] for i in range(n)]
+    return CACHE.get("negalucas", check(n), iter_negalucas)
+
+
+def iter_supergolden() -> Iterator[int]:
+    """yields the terms of the Supergolden Sequence one by one
+    1, 1, 1, 2, 3, ..."""
+
+    a, b, c = RECURRENCES["supergolden"].initial
+    while True:
+        yield a
+        a, b, c = b, c, c + a
 
 
 def supergolden(n: int) -> list[int]:
@@ -606,15 +896,17 @@ def supergolden(n: int) -> list[int]:
         Sₙ = 1 if n in (0, 1, 2)
         Sₙ = Sₙ₋₁ + Sₙ₋₃ otherwise"""
 
-    n, numbers = check(n), [1] * 3
+    return CACHE.get("supergolden", check(n), iter_supergolden)
 
-    if n in range(1, 4):
-        return [1] * n
 
-    while len(numbers) < n:
-        numbers.append(numbers[-1] + numbers[-3])
+def iter_padovan() -> Iterator[int]:
+    """yields the terms of the Padovan Sequence one by one
+    1, 1, 1, 2, 2, ..."""
 
-    return numbers
+    a, b, c = RECURRENCES["padovan"].initial
+    while True:
+        yield a
+        a, b, c = b, c, a + b
 
 
 def padovan(n: int) -> list[int]:
@@ -623,15 +915,17 @@ def padovan(n: int) -> list[int]:
         Pₙ = 1 if n in (0, 1, 2)
         Pₙ = Pₙ₋₂ + Pₙ₋₃ otherwise"""
 
-    n, numbers = check(n), [1] * 3
+    return CACHE.get("padovan", check(n), iter_padovan)
 
-    if n in range(1, 4):
-        return [1] * n
 
-    while len(numbers) < n:
-        numbers.append(numbers[-2] + numbers[-3])
+def iter_perrin() -> Iterator[int]:
+    """yields the terms of the Perrin Sequence one by one
+    3, 0, 2, 3, 2, ..."""
 
-    return numbers
+    a, b, c = RECURRENCES["perrin"].initial
+    while True:
+        yield a
+        a, b, c = b, c, a + b
 
 
 def perrin(n: int) -> list[int]:
@@ -642,15 +936,17 @@ def perrin(n: int) -> list[int]:
         Pₙ = 2 if n == 2
         Pₙ = Pₙ₋₂ + Pₙ₋₃ otherwise"""
 
-    n, numbers = check(n), [3, 0, 2]
+    return CACHE.get("perrin", check(n), iter_perrin)
 
-    if n in range(1, 4):
-        return numbers[:n]
 
-    while len(numbers) < n:
-        numbers.append(numbers[-2] + numbers[-3])
+def iter_pell() -> Iterator[int]:
+    """yields the terms of the Pell Sequence one by one
+    0, 1, 2, 5, 12, ..."""
 
-    return numbers
+    a, b = RECURRENCES["pell"].initial
+    while True:
+        yield a
+        a, b = b, 2*b + a
 
 
 def pell(n: int) -> list[int]:
@@ -660,15 +956,17 @@ def pell(n: int) -> list[int]:
         Pₙ = 1 if n == 1
         Pₙ = 2Pₙ₋₁ + Pₙ₋₂ otherwise"""
 
-    n, numbers = check(n), [0, 1]
+    return CACHE.get("pell", check(n), iter_pell)
 
-    if n in range(1, 3):
-        return numbers[:n]
 
-    while len(numbers) < n:
-        numbers.append(2*numbers[-1] + numbers[-2])
+def iter_jacobstathal() -> Iterator[int]:
+    """yields the terms of the Jacobstathal Sequence one by one
+    0, 1, 1, 3, 5, ..."""
 
-    return numbers
+    a, b = RECURRENCES["jacobstathal"].initial
+    while True:
+        yield a
+        a, b = b, b + 2*a
 
 
 def jacobstathal(n: int) -> list[int]:
@@ -678,114 +976,229 @@ def jacobstathal(n: int) -> list[int]:
         Jₙ = 1 if n == 1
         Jₙ = Jₙ₋₁ + 2Jₙ₋₂ otherwise"""
 
-    n, numbers = check(n), [0, 1]
-
-    if n in range(1, 3):
-        return numbers[:n]
-
-    while len(numbers) < n:
-        numbers.append(numbers[-1] + 2*numbers[-2])
-
-    return numbers
-
-
-def sylvester(n: int) -> list[int]:
-    """returns the first n terms of the Sylvester Sequence
+    return CACHE.get("jacobstathal", check(n), iter_jacobstathal)
+
+
+# name: (k-th term, number of terms below x), both in O(digits)
+INDEXED = {
+    "palindrome": (digits.palindrome_at, digits.palindromes_below),
+    "undulating": (digits.undulating_at, digits.undulatings_below),
+}
+
+
+def nth(name: str, k: int, modulus: int | None = None) -> int:
+    """returns the k-th term (counting from 0) of the sequence 'name' reduced
+    modulo 'modulus' if it is given, without computing the terms before it
+    example: nth("fibonacci", 10) -> 55
+    'name' is one of the linear recurrences, computed in O(log k) arithmetic
+    operations: fibonacci, negafibonacci, tribonacci, negatribonacci, lucas,
+    negalucas, supergolden, padovan, perrin, pell, jacobstathal
+    or one of the sequences built digit by digit, in O(digits of the term):
+    palindrome, undulating"""
+
+    if name not in RECURRENCES and name not in INDEXED:
+        raise ValueError (f"'{name}' has no direct access to its terms")
+    if not isinstance(k, int):
+        raise TypeError ("'k' must be an int")
+    if k < 0:
+        raise ValueError ("'k' must be a non-negative integer")
+    if modulus is not None:
+        if not isinstance(modulus, int):
+            raise TypeError ("'modulus' must be an int")
+        if modulus <= 0:
+            raise ValueError ("'modulus' must be a positive integer")
+
+    if name in INDEXED:
+        term = INDEXED[name][0](k)
+        return term if modulus is None else term % modulus
+    return RECURRENCES[name].nth(k, modulus)
+
+
+def rank(name: str, x: int) -> int:
+    """returns the number of terms of the sequence 'name' less than x, which
+    is also the index of the first term that is not, in O(digits of x)
+    example: rank("palindrome", 100) -> 19
+    'name' is one of: palindrome, undulating"""
+
+    if name not in INDEXED:
+        raise ValueError (f"'{name}' cannot be ranked")
+    if not isinstance(x, int):
+        raise TypeError ("'x' must be an int")
+    return INDEXED[name][1](x)
+
+
+def iter_sylvester(modulus: int | None = None) -> Iterator[int]:
+    """yields the terms of the Sylvester Sequence one by one, or their
+    residues modulo 'modulus' if it is given
+    2, 3, 7, 43, 1807, ..."""
+
+    # Sₙ₊₁ = S₀S₁...Sₙ + 1 = Sₙ(Sₙ - 1) + 1, one product per term
+    term = 2 if modulus is None else 2 % modulus
+    while True:
+        yield term
+        term = term * (term-1) + 1
+        if modulus is not None:
+            term %= modulus
+
+
+def sylvester(n: int, modulus: int | None = None) -> list[int]:
+    """returns the first n terms of the Sylvester Sequence, or their residues
+    modulo 'modulus' if it is given, which keeps every term small
     Sylvester Sequence is defined as:
         Sₙ = 2 if n == 0
         Sₙ = product(sylvester(n-1)) + 1 otherwise"""
 
-    n, numbers = check(n), list()
+    if modulus is None:
+        return CACHE.get("sylvester", check(n), iter_sylvester)
+    check(modulus, "modulus")
+    return CACHE.get(
+        ("sylvester", modulus), check(n), lambda: iter_sylvester(modulus)
+    )
+
 
-    while len(numbers) < n:
-        num = 1
-        for i in numbers:
-            num *= i
-        numbers.append(num + 1)
+def iter_euclid_mullin() -> Iterator[int]:
+    """yields the terms of the Euclid-Mullin Sequence one by one
+    2, 3, 7, 43, 13, ..."""
 
-    return numbers
+    # resume after the terms already in the store rather than factoring the
+    # products that gave them again
+    product = 1
+    for num in STORE.read("euclid_mullin", STORE.count("euclid_mullin")):
+        yield num
+        product *= num
 
+    while True:
+        num = smallest_prime_factor(product + 1)
+        yield num
+        product *= num
 
-def euclid_mullin(n: int) -> list[int]:
-    """returns the first n terms of the Euclid-Mullin Sequence
+
+def euclid_mullin(n: int, modulus: int | None = None) -> list[int]:
+    """returns the first n terms of the Euclid-Mullin Sequence, or their
+    residues modulo 'modulus' if it is given
     Euclid-Mullin Sequence is defined as:
         Tₙ = 2 if n == 1
         Tₙ = smallest prime factor of product(euclid_mullin(n-1))+1 otherwise"""
 
-    n, numbers = check(n), [2]
+    if modulus is not None:
+        check(modulus, "modulus")
+    terms = STORE.fetch("euclid_mullin", check(n), lambda n: CACHE.get(
+        "euclid_mullin", n, iter_euclid_mullin
+    ))
+    return terms if modulus is None else [num % modulus for num in terms]
+
 
-    def smallest_factor(x):
-        """returns the smallest prime factor of x"""
+def iter_sophie_germain() -> Iterator[int]:
+    """yields the terms of the Sophie-Germain Prime Number Sequence one by one
+    2, 3, 5, 11, 23, ..."""
 
-        if isprime(x):
-            return x
+    return (p for p in SIEVE if isprime(2*p + 1))
 
-        for i in range(2, x+1):
-            if isprime(i) and (not x % i):
-                return i
 
-    while len(numbers) < n:
-        num = 1
-        for i in numbers:
-            num *= i
-        numbers.append(smallest_factor(num + 1))
+def is_sophie_germain(x: int) -> bool:
+    """returns True if x is a Sophie-Germain Prime Number"""
 
-    return numbers
+    return isprime(x) and isprime(2*x + 1)
 
 
-def sophie_germain(n: int) -> list[int]:
+def sophie_germain(n: int, workers: int | None = None) -> list[int]:
     """returns the first n terms of the Sophie-Germain Prime Number Sequence
     Sophie Germain Prime Number:
-        prime number x such that 2x + 1 is also prime"""
+        prime number x such that 2x + 1 is also prime
+    workers: number of processes searching in parallel, one by default"""
 
-    n, numbers, num = check(n), list(), 2
+    if workers is not None:
+        return scan(is_sophie_germain, check(n), 2, check(workers, "workers"))
+    return CACHE.get("sophie_germain", check(n), iter_sophie_germain)
 
-    while len(numbers) < n:
-        if isprime(num) and isprime(2*num + 1):
-            numbers.append(num)
-        num += 1
 
-    return numbers
+# past this many digits, the repunit mode of circular_prime only tests the
+# repunits, as no other Circular Prime is known beyond 199933
+REPUNIT_LENGTH = 7
 
+# the number of Circular Primes up to 199933, the later known ones being
+# repunits, which a search through every number (or necklace) never reaches
+SEARCHED_TERMS = 19
 
-def circular_prime(n: int) -> list[int]:
-    """returns the first n terms of the Circular-Prime Number Sequence
-    Circular Prime Number:
-        number such that all of its cyclic permutations are prime"""
 
-    n, numbers, num = check(n), list(), 2
+def iter_circular_prime(repunits: bool = False) -> Iterator[int]:
+    """yields the terms of the Circular-Prime Number Sequence one by one
+    2, 3, 5, 7, 11, ...
+    with 'repunits', numbers of more than REPUNIT_LENGTH digits are only
+    searched among the repunits; without, the terms after the first
+    SEARCHED_TERMS take far too long to be found"""
 
-    def perm(x):
-        """returns all cyclic permutations of x"""
+    yield from (2, 3, 5, 7)
+    # every digit of a multi-digit Circular Prime ends one of its rotations,
+    # so it is 1, 3, 7 or 9; each class of rotations is built once, from its
+    # smallest member
+    for length in count(2):
+        if repunits and length > REPUNIT_LENGTH:
+            break
+        for necklace in digits.necklaces(length, "1379"):
+            number = int(necklace)
+            if number % 3 and all(map(isprime, digits.rotations(number))):
+                yield number
 
-        x, all_x = str(x), [x]
-        for i in range(len(x)):
-            x = x[-1] + x[:-1]
-            all_x.append(int(x))
-        return all_x
+    for length in count(REPUNIT_LENGTH + 1):
+        if isprime(length) and is_repunit_prime(length):
+            yield (pow(10, length) - 1) // 9
 
-    def is_circ_prime(x):
-        """returns True if all cylic permutations of x are prime"""
 
-        if x in (2, 3, 5, 7):
-            return True
+def is_circular_prime(x: int) -> bool:
+    """returns True if x is a Circular Prime Number, and the smallest of its
+    cyclic permutations (which are listed only once, at the first of them)"""
 
-        for p in perm(x):
-            for i in range(2, int(pow(p, 0.5) + 1)):
-                if not (p % i):
-                    return False
-        return True
+    if x > 10 and not set(str(x)) <= set("1379"):
+        return False
+    rotations = digits.rotations(x)
+    return x == min(rotations) and all(isprime(p) for p in rotations)
 
-    while len(numbers) < n:
-        if is_circ_prime(num):
-            for z in perm(num):
-                if z in numbers:
-                    break
-            else:
-                numbers.append(num)
-        num += 1
 
-    return numbers
+def circular_prime(
+    n: int, workers: int | None = None, repunits: bool = False
+) -> list[int]:
+    """returns the first n terms of the Circular-Prime Number Sequence
+    Circular Prime Number:
+        number such that all of its cyclic permutations are prime
+    workers: number of processes searching in parallel, one by default,
+        unused with 'repunits'
+    repunits: only search the repunits among numbers of more than
+        REPUNIT_LENGTH digits, which gives the 23 known terms (up to the
+        1031-digit repunit) in a few seconds
+    without 'repunits', n is at most SEARCHED_TERMS, as the search would
+    have to go through every number of up to 19 digits to reach the next
+    term, the repunit R₁₉"""
+
+    if check(n) > SEARCHED_TERMS and not repunits:
+        raise ValueError (
+            f"only the first {SEARCHED_TERMS} terms can be searched for, "
+            "the next ones are repunits, use repunits=True"
+        )
+    if workers is not None and not repunits:
+        return scan(is_circular_prime, n, 2, check(workers, "workers"))
+    name = "circular_prime_repunit" if repunits else "circular_prime"
+    return STORE.fetch(name, check(n), lambda n: CACHE.get(
+        name, n, lambda: iter_circular_prime(repunits)
+    ))
+
+
+def iter_prime_powers() -> Iterator[int]:
+    """yields the Prime Power Numbers one by one
+    2, 3, 4, 5, 7, ..."""
+
+    # the primes, merged with their higher powers: pᵏ⁺¹ replaces pᵏ on the
+    # heap once yielded, and p² is only pushed once it is below the primes
+    powers, root = list(), 0
+    for p in SIEVE:
+        while (q := SIEVE.primes[root]) * q < p:
+            heapq.heappush(powers, (q * q, q))
+            root += 1
+        while powers and powers[0][0] < p:
+            power, base = powers[0]
+            yield power
+            heapq.heapreplace(powers, (power * base, base))
+        yield p
 
 
 def prime_powers(n: int) -> list[int]:
@@ -793,28 +1206,14 @@ def prime_powers(n: int) -> list[int]:
     Prime Power Number:
         number of the form xⁿ where x is prime and n is any positive integer"""
 
-    n, numbers, num = check(n), [2], 3
-
-    def is_prime_power(x):
-        """returns True if x is a Prime Power Number"""
+    return CACHE.get("prime_powers", check(n), iter_prime_powers)
 
-        copy = x
-        for i in prime(x):
-            while copy != 1:
-                if copy % i:
-                    break
-                copy //= i
-            else:
-                return True
-            copy = x
-        return False
 
-    while len(numbers) < n:
-        if is_prime_power(num):
-            numbers.append(num)
-        num += 1
+def iter_semiprime() -> Iterator[int]:
+    """yields the Semi-Prime Numbers one by one
+    4, 6, 9, 10, 14, ..."""
 
-    return numbers
+    return TABLES.iterate(semiprime_mask)
 
 
 def semiprime(n: int) -> list[int]:
@@ -822,28 +1221,14 @@ def semiprime(n: int) -> list[int]:
     Semi-Prime Number:
         the product of two prime numbers, not necessarily distinct"""
 
-    n, numbers, num = check(n), list(), 4
+    return TABLES.select(check(n), semiprime_mask, estimate=5*n + 64)
 
-    def factors(x):
-        """returns the number of prime factors of x (not unique)"""
 
-        total, i = 0, 2
-        while x != 1:
-            if not isprime(i):
-                i += 1
-            if not (x % i):
-                x //= i
-                total += 1
-            else:
-                i += 1
-        return total
+def iter_sphenic() -> Iterator[int]:
+    """yields the terms of the Sphenic Number Sequence one by one
+    30, 42, 66, 70, 78, ..."""
 
-    while len(numbers) < n:
-        if factors(num) == 2:
-            numbers.append(num)
-        num += 1
-
-    return numbers
+    return TABLES.iterate(sphenic_mask)
 
 
 def sphenic(n: int) -> list[int]:
@@ -851,25 +1236,91 @@ def sphenic(n: int) -> list[int]:
     Sphenic Number:
         number that is the product of three distinct primes"""
 
-    n, numbers, num = check(n), list(), 30
-
-    def factors(x):
-        """returns the number of unique prime factors of x"""
-
-        divs, i = list(), 2
-        while x != 1:
-            if not isprime(i):
-                i += 1
-            if not (x % i):
-                x //= i
-                divs.append(i)
-            else:
-                i += 1
-        return divs
+    return TABLES.select(check(n), sphenic_mask, estimate=5*n + 64)
+
+
+# the names of the functions returning the first n terms of a sequence (or,
+# for pascal, the n-th row), which batch, sequences.aio and sequences.bench
+# accept; the functions are looked up by name, instrumented or not
+SEQUENCES = frozenset((
+    "whole", "natural", "negative", "square", "cube", "prime", "composite",
+    "factorial", "palindrome", "triangular", "tetrahedral", "octahedral",
+    "dodecahedral", "icosahedral", "sq_pyramid", "star", "stella_octangula",
+    "central_polygon", "magic_constants", "woodall", "cullen", "pronic",
+    "arithmetic", "carol", "perfect", "undulating", "pascal", "gould",
+    "central_binomial", "catalan", "van_eck", "recaman", "look_say",
+    "look_say_lengths", "aronson", "baum_sweet", "fibonacci", "negafibonacci",
+    "tribonacci", "negatribonacci", "lucas", "negalucas", "supergolden",
+    "padovan", "perrin", "pell", "jacobstathal", "sylvester", "euclid_mullin",
+    "sophie_germain", "circular_prime", "prime_powers", "semiprime", "sphenic",
+))
+
+
+# the shared work behind the sequences: base -> {sequence: bound for n terms}
+BASES = {
+    "sieve": {
+        "prime": SIEVE.bound, "prime_powers": SIEVE.bound,
+        "composite": lambda n: 2*n + 16,
+    },
+    "tables": {
+        "arithmetic": lambda n: 2*n + 64,
+        "semiprime": lambda n: 5*n + 64, "sphenic": lambda n: 5*n + 64,
+    },
+    "fibonacci": {
+        "fibonacci": lambda n: n, "negafibonacci": lambda n: n,
+        "lucas": lambda n: n + 1, "negalucas": lambda n: n + 1,
+    },
+}
+
+
+def batch(requests: list[tuple[str, int]]) -> list[list[int]]:
+    """returns the terms asked for by each (sequence name, n) request, in order
+    the work the requests share is done once, for the largest n needing it:
+        the prime sieve, for prime, prime_powers and composite
+        the divisor tables, for arithmetic, semiprime and sphenic
+        the Fibonacci numbers, for fibonacci, negafibonacci, lucas and
+        negalucas (Lₖ = Fₖ₋₁ + Fₖ₊₁)
+    example:
+        batch([("fibonacci", 5), ("lucas", 3)])
+        -> [[0, 1, 1, 2, 3], [2, 1, 3]]"""
+
+    largest = dict()
+    for name, n in requests:
+        if name not in SEQUENCES:
+            raise ValueError (f"'{name}' is not a sequence")
+        largest[name] = max(largest.get(name, 0), check(n))
+
+    bounds = dict()
+    for base, needs in BASES.items():
+        for name in largest.keys() & needs.keys():
+            bound = needs[name](largest[name])
+            bounds[base] = max(bounds.get(base, 0), bound)
+
+    if "sieve" in bounds:
+        SIEVE.extend(bounds["sieve"] + 1)
+    if "tables" in bounds:
+        TABLES.extend(bounds["tables"])
+
+    derived = dict()
+    if "fibonacci" in bounds:
+        fibs = fibonacci(bounds["fibonacci"] + 1)
+        lucases = [2] + [fibs[k-1] + fibs[k+1] for k in range(1, len(fibs)-1)]
+        derived = {
+            "fibonacci": fibs, "negafibonacci": list(alternate(fibs, -1)),
+            "lucas": lucases, "negalucas": list(alternate(lucases)),
+        }
 
-    while len(numbers) < n:
-        if len(f := factors(num)) == len(set(f)) == 3:
-            numbers.append(num)
-        num += 1
+    # the other functions are called for each distinct n, as not all of them
+    # return prefixes of one another (pascal(n) is the n-th row)
+    results = dict()
+    for request in requests:
+        if request in results:
+            continue
+        name, n = request
+        if name in derived:
+            results[request] = derived[name][:n]
+        else:
+            results[request] = globals()[name](n)
 
-    return numbers
+    # a copy each, as the same request may be asked for twice
+    return [list(results[request]) for request in requests]
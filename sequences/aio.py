@@ -0,0 +1,233 @@
+"""sequences.aio
+Contains the asyncio facade of the module: every function of sequences has an
+awaitable counterpart of the same name, run by a pool of worker processes so
+that the event loop is never blocked
+    primes = await sequences.aio.prime(10**6)
+    async for terms in sequences.aio.stream("prime", 1000): ...
+the workers are long-lived, so that their term caches stay warm from one
+request to the next, and a request whose every caller was cancelled kills its
+worker, wherever it is in its computation, and starts a fresh one
+identical requests made while one is in flight share its result"""
+
+
+import asyncio
+import atexit
+import multiprocessing
+import os
+import sys
+from collections.abc import AsyncIterator, Callable
+from itertools import islice
+
+from . import SEQUENCES
+
+
+# the number of worker processes, os.cpu_count() unless configure() sets it
+WORKERS = None
+
+# the workers waiting for a request, and the slots limiting the busy ones,
+# one semaphore per event loop
+IDLE = list()
+SLOTS = dict()
+
+# (name, args, kwargs) of the requests in flight: [task, number of callers]
+INFLIGHT = dict()
+
+
+class Worker:
+    """a process running the functions of the module, one request at a time"""
+
+    def __init__(self) -> None:
+        self.connection, child = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(
+            target=serve, args=(child,), daemon=False
+        )
+        self.process.start()
+        child.close()
+
+    async def run(self, job: tuple) -> object:
+        """returns the result of job, a (function, args) pair computed by the
+        worker, killing the worker if the caller is cancelled"""
+
+        loop = asyncio.get_running_loop()
+        try:
+            self.connection.send(job)
+            status, result = await loop.run_in_executor(
+                None, self.connection.recv
+            )
+        except asyncio.CancelledError:
+            self.kill()
+            raise
+        if status == "error":
+            raise result
+        return result
+
+    def kill(self) -> None:
+        """stops the worker at once"""
+
+        self.process.kill()
+        self.process.join()
+        self.connection.close()
+
+
+def serve(connection) -> None:
+    """runs the jobs received on connection until it is closed"""
+
+    while True:
+        try:
+            function, args = connection.recv()
+        except EOFError:
+            return
+        try:
+            result = ("ok", function(*args))
+        except Exception as error:
+            result = ("error", error)
+        try:
+            connection.send(result)
+        except Exception as error:
+            # the result or the error cannot be pickled
+            connection.send(("error", RuntimeError (repr(error))))
+
+
+def configure(workers: int | None = None) -> None:
+    """runs the requests on at most 'workers' processes (os.cpu_count() by
+    default), stopping the idle workers"""
+
+    global WORKERS
+    WORKERS = workers
+    SLOTS.clear()
+    shutdown()
+
+
+def shutdown() -> None:
+    """kills the idle workers"""
+
+    while IDLE:
+        IDLE.pop().kill()
+
+
+atexit.register(shutdown)
+
+
+def slots() -> asyncio.Semaphore:
+    """returns the semaphore of the running event loop, limiting the number
+    of busy workers"""
+
+    loop = asyncio.get_running_loop()
+    if loop not in SLOTS:
+        SLOTS.clear()
+        SLOTS[loop] = asyncio.Semaphore(WORKERS or os.cpu_count() or 1)
+    return SLOTS[loop]
+
+
+async def execute(function: Callable, *args) -> object:
+    """returns function(*args), computed by an idle worker"""
+
+    semaphore = slots()
+    async with semaphore:
+        worker = IDLE.pop() if IDLE else Worker()
+        try:
+            result = await worker.run((function, args))
+        except asyncio.CancelledError:
+            # the worker was killed, a new one takes its place when needed
+            raise
+        except BaseException:
+            IDLE.append(worker)
+            raise
+        IDLE.append(worker)
+        return result
+
+
+def work(name: str, args: tuple, kwargs: dict) -> object:
+    """returns the result of the function 'name' of the module, called with
+    args and kwargs in the worker process"""
+
+    return getattr(sys.modules[__package__], name)(*args, **kwargs)
+
+
+async def call(name: str, *args, **kwargs) -> object:
+    """returns the result of the function 'name' of the module called with
+    args and kwargs, sharing it with the identical requests in flight"""
+
+    if not callable(getattr(sys.modules[__package__], name, None)):
+        raise AttributeError (f"sequences has no function '{name}'")
+    key = (name, args, tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return await execute(work, name, args, kwargs)
+
+    if key not in INFLIGHT:
+        task = asyncio.ensure_future(execute(work, name, args, kwargs))
+        INFLIGHT[key] = [task, 0]
+    entry = INFLIGHT[key]
+    entry[1] += 1
+    try:
+        # shielded, so that one caller being cancelled does not cancel the
+        # others
+        return await asyncio.shield(entry[0])
+    except asyncio.CancelledError:
+        if entry[1] == 1:
+            entry[0].cancel()
+        raise
+    finally:
+        entry[1] -= 1
+        if (entry[0].done() or not entry[1]) and INFLIGHT.get(key) is entry:
+            del INFLIGHT[key]
+
+
+async def stream(
+    name: str, chunk: int = 1 << 10, **kwargs
+) -> AsyncIterator[list]:
+    """yields the terms of the sequence 'name' chunk by chunk, until there
+    are no more of them
+    the terms come from iter_<name>(**kwargs), kept running by a worker of
+    the stream's own, so that each chunk only computes its own terms; the
+    worker is killed when the stream is closed"""
+
+    if name not in SEQUENCES:
+        raise ValueError (f"'{name}' is not a sequence of the module")
+    worker = Worker()
+    try:
+        await worker.run((start, (name, kwargs)))
+        while True:
+            terms = await worker.run((take, (chunk,)))
+            if terms:
+                yield terms
+            if len(terms) < chunk:
+                return
+    finally:
+        worker.kill()
+
+
+# the generator of the stream a worker serves, in the worker process
+GENERATOR = None
+
+
+def start(name: str, kwargs: dict) -> None:
+    """starts the generator of the sequence 'name' in the worker"""
+
+    global GENERATOR
+    GENERATOR = getattr(sys.modules[__package__], f"iter_{name}")(**kwargs)
+
+
+def take(chunk: int) -> list:
+    """returns the next chunk terms of the generator of the worker"""
+
+    return list(islice(GENERATOR, chunk))
+
+
+def __getattr__(name: str) -> Callable:
+    """returns the awaitable counterpart of the function 'name' of the
+    module"""
+
+    if name.startswith(("_", "iter_")) or not callable(
+        getattr(sys.modules[__package__], name, None)
+    ):
+        # generators cannot be sent back from the workers, see stream()
+        raise AttributeError (f"module 'sequences.aio' has no '{name}'")
+
+    async def facade(*args, **kwargs):
+        return await call(name, *args, **kwargs)
+
+    facade.__name__ = facade.__qualname__ = name
+    return facade
@@ -0,0 +1,242 @@
+"""sequences.bench
+Contains the benchmark suite of the module, run with
+    python -m sequences.bench [name ...] [--output FILE]
+    python -m sequences.bench --compare BASELINE [CURRENT] [--threshold 0.25]
+every public sequence function f(n) is timed, from a cold state, on the
+ladder n = 1, 2, 4, 8, ... until a run takes longer than the budget, and its
+empirical complexity exponent k (time ~ nᵏ) is fitted by least squares on
+the log-log points; the peak memory of the largest run is traced
+the results are saved as JSON, and two such files can be compared to flag
+the sequences that became slower than some threshold"""
+
+
+import argparse
+import json
+import math
+import platform
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from . import SEQUENCES
+from .cache import CACHE
+from .multiplicative import TABLES
+from .sieve import SIEVE
+from .store import STORE
+
+
+# the largest n each sequence is timed at, for those whose cost explodes
+# faster than the ladder can notice (look_say's int terms cannot go past the
+# 4300 digits of int(str) either)
+LIMITS = {
+    "euclid_mullin": 12, "perfect": 16, "circular_prime": 19,
+    "sylvester": 24, "look_say": 29, "look_say_lengths": 64,
+}
+
+# the NumPy versions of some sequences, timed along with the sequences
+ARRAYS = frozenset(("baum_sweet_array", "gould_array"))
+
+# runs faster than this (in seconds) are too noisy to fit or compare
+FLOOR = 1e-4
+
+
+def functions() -> dict[str, Callable[[int], list]]:
+    """returns the functions of the module computing the first n terms of a
+    sequence, and those filling NumPy arrays of them, keyed by name"""
+
+    package = sys.modules[__package__]
+    return {name: getattr(package, name) for name in sorted(SEQUENCES | ARRAYS)}
+
+
+def reset() -> None:
+    """drops the cached terms, the sieved primes and the divisor tables, so
+    that every run starts from a cold state"""
+
+    CACHE.clear()
+    SIEVE.__init__(SIEVE.segment)
+    TABLES.__init__()
+
+
+def measure(function: Callable[[int], list], n: int, repeat: int) -> float:
+    """returns the best time of 'repeat' cold runs of function(n)"""
+
+    best = math.inf
+    for _ in range(repeat):
+        reset()
+        start = time.perf_counter()
+        function(n)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def peak(function: Callable[[int], list], n: int) -> int:
+    """returns the peak memory (in bytes) allocated by a cold run of
+    function(n)"""
+
+    reset()
+    tracemalloc.start()
+    try:
+        function(n)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def exponent(ns: list[int], seconds: list[float]) -> float | None:
+    """returns the slope of log(seconds) against log(n), fitted by least
+    squares on the runs above FLOOR, or None if there are fewer than two"""
+
+    points = [
+        (math.log(n), math.log(t)) for n, t in zip(ns, seconds) if t >= FLOOR
+    ]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    if not spread:
+        return None
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+    return round(slope, 3)
+
+
+def profile(
+    function: Callable[[int], list], limit: int, budget: float, repeat: int
+) -> dict:
+    """returns the ladder of n, the best times, the fitted exponent and the
+    peak memory of function, stopping once a run takes more than budget"""
+
+    ns, seconds = list(), list()
+    n = 1
+    while n <= limit:
+        ns.append(n)
+        seconds.append(measure(function, n, repeat))
+        if seconds[-1] > budget:
+            break
+        n *= 2
+    return {
+        "n": ns, "seconds": seconds, "exponent": exponent(ns, seconds),
+        "peak": peak(function, ns[-1]),
+    }
+
+
+def run(
+    names: list[str] | None = None, max_n: int = 1 << 20,
+    budget: float = 0.5, repeat: int = 3, log=sys.stderr,
+) -> dict:
+    """returns the profile of every sequence in names (all of them by
+    default), together with the platform it was measured on
+    'log' receives one line per sequence, None silences it"""
+
+    available = functions()
+    if names is None:
+        names = sorted(available)
+    for name in names:
+        if name not in available:
+            raise ValueError (f"'{name}' is not a benchmarked sequence")
+
+    # the terms on disk would be read instead of computed
+    directory = STORE.directory
+    STORE.close()
+
+    results = dict()
+    try:
+        for name in names:
+            try:
+                result = profile(
+                    available[name], min(max_n, LIMITS.get(name, max_n)),
+                    budget, repeat,
+                )
+            except ImportError:
+                # the optional backends (NumPy) may be missing
+                continue
+            results[name] = result
+            if log is not None:
+                print(
+                    f"{name:24} n ≤ {result['n'][-1]:<8} "
+                    f"{result['seconds'][-1]:10.4f} s   "
+                    f"k = {result['exponent']}   peak = {result['peak']} B",
+                    file=log,
+                )
+    finally:
+        if directory is not None:
+            STORE.open(directory)
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.25) -> list:
+    """returns the regressions of current against baseline: the (name, n,
+    baseline seconds, current seconds) of every run slower than baseline by
+    more than 'threshold' (a fraction), ignoring runs below FLOOR"""
+
+    regressions = list()
+    for name, new in current["results"].items():
+        if name not in baseline["results"]:
+            continue
+        old = baseline["results"][name]
+        before = dict(zip(old["n"], old["seconds"]))
+        for n, seconds in zip(new["n"], new["seconds"]):
+            if n not in before or max(before[n], seconds) < FLOOR:
+                continue
+            if seconds > before[n] * (1 + threshold):
+                regressions.append((name, n, before[n], seconds))
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    """the command line of the benchmark suite, returns its exit status:
+    1 if a comparison found regressions, 0 otherwise"""
+
+    parser = argparse.ArgumentParser(
+        prog="python -m sequences.bench",
+        description="times the sequences of the module on growing n",
+    )
+    parser.add_argument("names", nargs="*", help="sequences to time (all)")
+    parser.add_argument("--output", "-o", help="JSON file for the results")
+    parser.add_argument("--max-n", type=int, default=1 << 20)
+    parser.add_argument("--budget", type=float, default=0.5,
+                        help="seconds after which a ladder stops (0.5)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--compare", nargs="+", metavar="FILE",
+                        help="BASELINE [CURRENT], runs the suite if CURRENT "
+                             "is not given")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="slowdown flagged by --compare (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    if args.compare and len(args.compare) > 2:
+        parser.error("--compare takes a BASELINE and at most one CURRENT")
+    if args.compare and len(args.compare) == 2:
+        with open(args.compare[1]) as file:
+            current = json.load(file)
+    else:
+        current = run(
+            args.names or None, args.max_n, args.budget, args.repeat
+        )
+        if args.output:
+            with open(args.output, "w") as file:
+                json.dump(current, file, indent=1)
+
+    if not args.compare:
+        return 0
+
+    with open(args.compare[0]) as file:
+        baseline = json.load(file)
+    regressions = compare(baseline, current, args.threshold)
+    for name, n, before, after in regressions:
+        print(
+            f"{name:24} n = {n:<8} {before:10.4f} s -> {after:10.4f} s "
+            f"({after / before:.2f}x)"
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""sequences.binomial
+Contains the binomial coefficient engine behind Pascal's Triangle, the Central
+Binomial Coefficients and the Catalan Numbers
+a row is streamed by the ratio ⁿCᵣ₊₁ = ⁿCᵣ (n - r) / (r + 1), starting from
+any r, so that a slice of a row never needs the coefficients before it
+rows modulo a prime p are computed digit by digit in base p (Lucas' theorem)
+    ⁿCᵣ ≡ ∏ ⁿⁱCᵣᵢ (mod p) where nᵢ, rᵢ are the base p digits of n, r"""
+
+
+import math
+from collections.abc import Iterator
+from itertools import count, repeat
+
+
+def row(n: int, start: int = 0, stop: int | None = None) -> Iterator[int]:
+    """yields ⁿCᵣ for r in range(start, stop), the whole row by default"""
+
+    stop = n + 1 if stop is None else min(stop, n + 1)
+    if start >= stop:
+        return
+    coefficient = math.comb(n, start)
+    for r in range(start, stop - 1):
+        yield coefficient
+        coefficient = coefficient * (n - r) // (r + 1)
+    yield coefficient
+
+
+def full_row(n: int) -> list[int]:
+    """returns the whole n-th row, mirroring its first half"""
+
+    half = list(row(n, 0, n // 2 + 1))
+    return half + half[: (n + 1) // 2][::-1]
+
+
+def row_mod(
+    n: int, p: int, start: int = 0, stop: int | None = None
+) -> Iterator[int]:
+    """yields ⁿCᵣ mod p for r in range(start, stop), p being prime"""
+
+    stop = n + 1 if stop is None else min(stop, n + 1)
+    if start >= stop:
+        return
+
+    if n < p:
+        # a single base p digit: the ratio recurrence never divides by p
+        coefficient = math.comb(n, start) % p
+        for r in range(start, stop - 1):
+            yield coefficient
+            coefficient = coefficient * (n - r) * pow(r + 1, -1, p) % p
+        yield coefficient
+        return
+
+    # the last base p digit of r runs through a block of p coefficients for
+    # each value of the others, which give the row of n // p
+    high_n, low_n = divmod(n, p)
+    low = list(row_mod(low_n, p)) + [0] * (p - 1 - low_n)
+    highs = row_mod(high_n, p, start // p, (stop - 1) // p + 1)
+    for high, block in zip(highs, range(start // p * p, stop, p)):
+        first, last = max(start - block, 0), min(stop - block, p)
+        if high:
+            yield from (high * x % p for x in low[first:last])
+        else:
+            yield from repeat(0, last - first)
+
+
+def central() -> Iterator[int]:
+    """yields ²ⁿCₙ for n = 0, 1, 2, ..., each from the one before it
+    ²⁽ⁿ⁺¹⁾Cₙ₊₁ = ²ⁿCₙ 2(2n + 1) / (n + 1)"""
+
+    coefficient = 1
+    for i in count(1):
+        yield coefficient
+        coefficient = coefficient * 2 * (2*i - 1) // i
+
+
+def catalan() -> Iterator[int]:
+    """yields the Catalan Numbers, each from the one before it
+    Cₙ₊₁ = Cₙ 2(2n + 1) / (n + 2)"""
+
+    number = 1
+    for i in count(1):
+        yield number
+        number = number * 2 * (2*i - 1) // (i + 1)
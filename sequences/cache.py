@@ -0,0 +1,106 @@
+"""sequences.cache
+Contains the process-wide cache of the terms computed by the module
+each sequence keeps its longest computed prefix together with the generator
+that produced it, so that a longer request only computes the missing terms
+each sequence has a lock of its own for generating its terms, so that a long
+computation only holds up the requests for the same sequence
+sequences are evicted least recently used first once the memory budget is
+exceeded"""
+
+
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+from itertools import islice
+
+
+class TermCache:
+    """the computed prefixes of the sequences, keyed by sequence name
+    'budget' is the approximate number of bytes all the prefixes may take
+    'observer', if set, is called with "hits", "misses" or "extensions" on
+    every lookup, in the thread making it"""
+
+    def __init__(self, budget: int = 1 << 26) -> None:
+        self.budget = budget
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = self.misses = self.extensions = self.evictions = 0
+        self.lock = threading.RLock()
+        self.observer = None
+
+    def get(
+        self, name: Hashable, n: int, generate: Callable[[], Iterator]
+    ) -> list:
+        """returns the first n terms of the sequence 'name', extending its
+        cached prefix from generate() if it is too short"""
+
+        with self.lock:
+            entry = self.entries.get(name)
+            if entry is None:
+                self.misses += 1
+                kind = "misses"
+                entry = [list(), generate(), 0, threading.RLock()]
+                self.entries[name] = entry
+            elif len(entry[0]) >= n:
+                self.hits += 1
+                kind = "hits"
+            else:
+                self.extensions += 1
+                kind = "extensions"
+            self.entries.move_to_end(name)
+            self.evict()
+        if self.observer is not None:
+            self.observer(kind)
+
+        # the terms are generated under the lock of this sequence only, so that
+        # the other sequences are served meanwhile
+        with entry[3]:
+            terms, iterator = entry[0], entry[1]
+            if len(terms) < n:
+                try:
+                    new = list(islice(iterator, n - len(terms)))
+                except BaseException:
+                    # the generator cannot be trusted to resume where it was
+                    with self.lock:
+                        if self.entries.get(name) is entry:
+                            del self.entries[name]
+                            self.size -= entry[2]
+                    raise
+                grown = 8*len(new) + sum(map(sys.getsizeof, new))
+                terms.extend(new)
+                with self.lock:
+                    entry[2] += grown
+                    # unless it was evicted while its terms were generated
+                    if self.entries.get(name) is entry:
+                        self.size += grown
+                        self.evict()
+            return terms[:n]
+
+    def evict(self) -> None:
+        """drops the least recently used prefixes until the budget is met"""
+
+        while self.size > self.budget and self.entries:
+            _, (_, _, size, _) = self.entries.popitem(last=False)
+            self.size -= size
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """drops every cached prefix, keeping the counters"""
+
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+    def stats(self) -> dict[str, int]:
+        """returns the hit, miss, extension and eviction counters, together
+        with the number of sequences and bytes currently cached"""
+
+        return {
+            "hits": self.hits, "misses": self.misses,
+            "extensions": self.extensions, "evictions": self.evictions,
+            "sequences": len(self.entries), "size": self.size,
+        }
+
+
+CACHE = TermCache()
@@ -0,0 +1,115 @@
+"""sequences.conway
+Contains the look-and-say engine based on Conway's Chemistry of audioactive
+decay: a term is stored as the array of "atoms" it splits into, i.e. pieces
+whose descendants never interact with their neighbours again, and each atom
+decays into the same atoms every day
+    1113122113 -> 311311222113 -> 13211321322113 -> ...
+the atoms are found as they appear, and once the term has split into Conway's
+92 elements, every step is a table lookup per atom"""
+
+
+import re
+from array import array
+from collections import Counter
+from collections.abc import Iterator
+from itertools import chain
+
+
+RUN = re.compile(rb"(.)\1*")
+
+# how many days the first digit of the right half of a split is followed, and
+# how many of its leading digits are kept while doing so
+HORIZON = 32
+WINDOW = 96
+
+
+def describe(digits: bytes) -> bytes:
+    """returns the look-and-say description of a string of digits
+    example: 1211 -> 111221"""
+
+    runs = RUN.finditer(digits)
+    return b"".join([b"%d%c" % (len(m[0]), m[1][0]) for m in runs])
+
+
+class ElementTable:
+    """the atoms met so far, stored once each, together with their decays"""
+
+    def __init__(self) -> None:
+        self.atoms = list()
+        self.index = dict()
+        self.decay = list()
+
+    def heads(self, digits: bytes) -> bytes | None:
+        """returns the first digit of each of the first HORIZON descendants of
+        digits, or None if the window kept is too short to know them"""
+
+        prefix, complete, heads = digits[:WINDOW], len(digits) <= WINDOW, list()
+        for _ in range(HORIZON):
+            heads.append(prefix[0])
+            if not complete:
+                # the last run may go on past the window, so it is dropped
+                prefix = prefix.rstrip(prefix[-1:])
+                if not prefix:
+                    return None
+            prefix = describe(prefix)
+            if len(prefix) > WINDOW:
+                prefix, complete = prefix[:WINDOW], False
+        return bytes(heads)
+
+    def split(self, digits: bytes) -> list[int]:
+        """returns the ids of the atoms digits splits into, adding new atoms
+        to the table
+        L|R splits when the last digit of L (which never changes) differs from
+        the first digit of every descendant of R"""
+
+        ids, start = list(), 0
+        for i in range(1, len(digits)):
+            heads = self.heads(digits[i:])
+            if heads is not None and digits[i-1] not in heads:
+                ids.append(self.id(digits[start:i]))
+                start = i
+        ids.append(self.id(digits[start:]))
+        return ids
+
+    def id(self, atom: bytes) -> int:
+        """returns the id of atom, registering it if it is new"""
+
+        if atom not in self.index:
+            self.index[atom] = len(self.atoms)
+            self.atoms.append(atom)
+            self.decay.append(None)
+        return self.index[atom]
+
+    def decays(self, i: int) -> tuple[int, ...]:
+        """returns the ids of the atoms that the i-th atom decays into"""
+
+        if self.decay[i] is None:
+            self.decay[i] = tuple(self.split(describe(self.atoms[i])))
+        return self.decay[i]
+
+
+ELEMENTS = ElementTable()
+
+
+def terms(seed: bytes = b"1") -> Iterator[bytes]:
+    """yields the look-and-say sequence starting from seed as digit strings
+    each term is kept as an array of atom ids, and only joined when yielded"""
+
+    ids = array("L", ELEMENTS.split(seed))
+    while True:
+        yield b"".join([ELEMENTS.atoms[i] for i in ids])
+        ids = array("L", chain.from_iterable(map(ELEMENTS.decays, ids)))
+
+
+def lengths(seed: bytes = b"1") -> Iterator[int]:
+    """yields the number of digits of each term of the look-and-say sequence
+    starting from seed, by counting how many of each atom every term holds"""
+
+    counts = Counter(ELEMENTS.split(seed))
+    while True:
+        yield sum(len(ELEMENTS.atoms[i]) * k for i, k in counts.items())
+        children = Counter()
+        for i, k in counts.items():
+            for j in ELEMENTS.decays(i):
+                children[j] += k
+        counts = children
@@ -0,0 +1,120 @@
+"""sequences.digits
+Contains the constructive enumeration of the numbers defined by the pattern of
+their digits, the Palindrome and the Undulating Numbers
+instead of testing every integer, the numbers of each length are built in order
+and the k-th number, or the count of numbers below x, is found in O(digits)
+the candidate Circular Primes are built as necklaces, one per class of
+rotations, out of the only digits a prime can end with"""
+
+
+from collections.abc import Iterator
+from itertools import count, product
+
+
+def mirror(half: int, length: int) -> int:
+    """returns the palindrome of 'length' digits whose first half is 'half'"""
+
+    digits = str(half)
+    return int(digits + digits[:length // 2][::-1])
+
+
+def palindromes() -> Iterator[int]:
+    """yields the Palindrome Numbers in increasing order"""
+
+    yield from range(10)
+    for length in count(2):
+        low = pow(10, (length - 1) // 2)
+        for half in range(low, 10 * low):
+            yield mirror(half, length)
+
+
+def palindrome_at(k: int) -> int:
+    """returns the k-th Palindrome Number (counting from 0)"""
+
+    if k < 10:
+        return k
+    k -= 10
+    length = 2
+    while k >= 9 * (low := pow(10, (length - 1) // 2)):
+        k -= 9 * low
+        length += 1
+    return mirror(low + k, length)
+
+
+def palindromes_below(x: int) -> int:
+    """returns the number of Palindrome Numbers less than x"""
+
+    if x <= 10:
+        return max(x, 0)
+    digits = str(x - 1)
+    length, total = len(digits), 10
+    for shorter in range(2, length):
+        total += 9 * pow(10, (shorter - 1) // 2)
+    half = int(digits[:(length + 1) // 2])
+    total += half - pow(10, (length - 1) // 2)
+    return total + (mirror(half, length) < x)
+
+
+def undulate(a: int, b: int, length: int) -> int:
+    """returns the number ABAB... of 'length' digits"""
+
+    pairs = (10*a + b) * (pow(100, length // 2) - 1) // 99
+    return 10*pairs + a if length % 2 else pairs
+
+
+# the (A, B) pairs of an Undulating Number, A ≠ B, in increasing order
+PAIRS = [(a, b) for a, b in product(range(1, 10), range(10)) if a != b]
+
+
+def undulatings() -> Iterator[int]:
+    """yields the Undulating Numbers in increasing order"""
+
+    for length in count(3):
+        for a, b in PAIRS:
+            yield undulate(a, b, length)
+
+
+def undulating_at(k: int) -> int:
+    """returns the k-th Undulating Number (counting from 0)"""
+
+    length, k = divmod(k, len(PAIRS))
+    return undulate(*PAIRS[k], length + 3)
+
+
+def undulatings_below(x: int) -> int:
+    """returns the number of Undulating Numbers less than x"""
+
+    if x <= 101:
+        return 0
+    length = len(str(x - 1))
+    total = len(PAIRS) * (length - 3)
+    return total + sum(undulate(a, b, length) < x for a, b in PAIRS)
+
+
+def necklaces(length: int, alphabet: str) -> Iterator[str]:
+    """yields, in lexicographic order, the strings of 'length' characters of
+    alphabet that are the smallest of their rotations and are not made of a
+    shorter block repeated, unless that block is a single character
+    (Fredricksen-Kessler-Maiorana algorithm, O(1) amortized per string)"""
+
+    last = len(alphabet) - 1
+    word, period = [0] * (length + 1), 1
+    while True:
+        if period in (1, length):
+            yield "".join(alphabet[i] for i in word[1:])
+        i = length
+        while word[i] == last:
+            i -= 1
+        if not i:
+            return
+        word[i] += 1
+        period = i
+        for j in range(i + 1, length + 1):
+            word[j] = word[j - i]
+
+
+def rotations(number: int) -> list[int]:
+    """returns every cyclic permutation of the digits of number"""
+
+    digits = str(number)
+    return [int(digits[i:] + digits[:i]) for i in range(len(digits))]
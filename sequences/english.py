@@ -0,0 +1,91 @@
+"""sequences.english
+Contains the English names of the integers used by the Aronson Sequence
+names are written without spaces, hyphens or "and", as only their letters
+matter: 124 -> "onehundredtwentyfourth"
+the names of 0 to 999 are built once, larger numbers are named three digits
+at a time up to the vigintillions (10⁶³) and beyond"""
+
+
+ONES = (
+    "", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine",
+    "ten", "eleven", "twelve", "thirteen", "fourteen", "fifteen", "sixteen",
+    "seventeen", "eighteen", "nineteen",
+)
+TENS = (
+    "", "", "twenty", "thirty", "forty", "fifty", "sixty", "seventy", "eighty",
+    "ninety",
+)
+SCALES = (
+    "", "thousand", "million", "billion", "trillion", "quadrillion",
+    "quintillion", "sextillion", "septillion", "octillion", "nonillion",
+    "decillion", "undecillion", "duodecillion", "tredecillion",
+    "quattuordecillion", "quindecillion", "sexdecillion", "septendecillion",
+    "octodecillion", "novemdecillion", "vigintillion",
+)
+
+# the ordinals whose last word is not simply followed by "th"
+IRREGULAR = {
+    "one": "first", "two": "second", "three": "third", "five": "fifth",
+    "eight": "eighth", "nine": "ninth", "twelve": "twelfth",
+}
+
+
+def _group(n: int) -> str:
+    """returns the name of 0 ≤ n < 1000, or "" for 0"""
+
+    hundreds, rest = divmod(n, 100)
+    name = f"{ONES[hundreds]}hundred" if hundreds else ""
+    if rest < 20:
+        return name + ONES[rest]
+    return name + TENS[rest // 10] + ONES[rest % 10]
+
+
+GROUPS = tuple(map(_group, range(1000)))
+
+
+def words(n: int) -> list[str]:
+    """returns the name of n > 0 as a list of words (without spaces)"""
+
+    parts, scale = list(), 0
+    while n:
+        n, group = divmod(n, 1000)
+        if group:
+            if scale >= len(SCALES):
+                # past the vigintillions, name the scale as a multiple of it
+                parts.append(words_scale(scale))
+            elif SCALES[scale]:
+                parts.append([SCALES[scale]])
+            parts.append([GROUPS[group]])
+        scale += 1
+    return [word for part in reversed(parts) for word in part]
+
+
+def words_scale(scale: int) -> list[str]:
+    """returns the words of 1000^scale for a scale beyond SCALES, e.g.
+    "thousand vigintillion" for 10⁶⁶"""
+
+    top = len(SCALES) - 1
+    extra, rest = divmod(scale, top)
+    return ([SCALES[rest]] if rest else []) + [SCALES[top]] * extra
+
+
+def cardinal(n: int) -> str:
+    """returns the name of n ≥ 0, e.g. 24 -> twentyfour"""
+
+    return "".join(words(n)) if n else "zero"
+
+
+def ordinal(n: int) -> str:
+    """returns the ordinal name of n ≥ 0, e.g. 24 -> twentyfourth"""
+
+    if not n:
+        return "zeroth"
+    *head, last = words(n)
+    # the last word is made of whole words from the tables, so its ending is
+    # either an irregular number, a -ty, or a word taking "th"
+    for ending, replacement in IRREGULAR.items():
+        if last.endswith(ending):
+            return "".join(head) + last[:-len(ending)] + replacement
+    if last.endswith("y"):
+        return "".join(head) + last[:-1] + "ieth"
+    return "".join(head) + last + "th"
@@ -0,0 +1,237 @@
+"""sequences.factor
+Contains the integer factorization engine shared by the sequences of the module
+small primes are removed by trial division from the sieve, larger cofactors are
+split by Pollard-Brent rho and, optionally, by the Elliptic Curve Method"""
+
+
+import math
+
+from .primality import is_probable_prime
+from .sieve import SIEVE
+
+
+TRIAL_BOUND = 1 << 12
+
+# (B1, number of curves) for each ECM round
+ECM_ROUNDS = ((2_000, 25), (11_000, 90), (50_000, 300), (250_000, 700))
+
+
+def pollard_brent(n: int, c: int = 1, limit: int | None = None) -> int | None:
+    """returns a non-trivial factor of the odd composite n found by Brent's
+    variant of Pollard's rho with f(x) = x² + c, or None if the walk fails or
+    exceeds 'limit' iterations"""
+
+    y, r, q, g, m = 2, 1, 1, 1, 128
+    x = ys = y
+
+    while g == 1:
+        x = y
+        for _ in range(r):
+            y = (y*y + c) % n
+        k = 0
+        while k < r and g == 1:
+            ys = y
+            for _ in range(min(m, r - k)):
+                y = (y*y + c) % n
+                q = q * abs(x - y) % n
+            g = math.gcd(q, n)
+            k += m
+        r <<= 1
+        if limit is not None and r > limit and g == 1:
+            return None
+
+    if g == n:
+        g = 1
+        while g == 1:
+            ys = (ys*ys + c) % n
+            g = math.gcd(abs(x - ys), n)
+
+    return g if g != n else None
+
+
+def _double(X, Z, a24, n):
+    """returns 2P for P = (X:Z) on a Montgomery curve"""
+
+    s, d = (X + Z) ** 2 % n, (X - Z) ** 2 % n
+    t = s - d
+    return s * d % n, t * (d + a24*t) % n
+
+
+def _add(Xp, Zp, Xq, Zq, Xd, Zd, n):
+    """returns P + Q given P, Q and their difference P - Q"""
+
+    u, v = (Xp - Zp) * (Xq + Zq), (Xp + Zp) * (Xq - Zq)
+    return Zd * (u + v) ** 2 % n, Xd * (u - v) ** 2 % n
+
+
+def _multiply(k, X, Z, a24, n):
+    """returns kP for P = (X:Z) with the Montgomery ladder"""
+
+    if k == 1:
+        return X, Z
+    R0, R1 = (X, Z), _double(X, Z, a24, n)
+    for bit in bin(k)[3:]:
+        if bit == "1":
+            R0, R1 = _add(*R1, *R0, X, Z, n), _double(*R1, a24, n)
+        else:
+            R0, R1 = _double(*R0, a24, n), _add(*R1, *R0, X, Z, n)
+    return R0
+
+
+def ecm(n: int, B1: int, curves: int, B2: int | None = None) -> int | None:
+    """returns a non-trivial factor of the composite n found by the Elliptic
+    Curve Method on Suyama-parametrised Montgomery curves, or None"""
+
+    B2 = 100 * B1 if B2 is None else B2
+    D = 210
+    primes = SIEVE.below(B2 + 1)
+    baby = [j for j in range(1, D // 2, 2) if math.gcd(j, D) == 1]
+
+    stage1 = list()
+    for p in primes:
+        if p > B1:
+            break
+        power = p
+        while power * p <= B1:
+            power *= p
+        stage1.append(power)
+
+    # the baby steps j that pair with each giant step mD to reach a prime
+    candidates, first = set(p for p in primes if p > B1), max(1, B1 // D)
+    steps = [
+        [j for j in baby if m*D - j in candidates or m*D + j in candidates]
+        for m in range(first, B2 // D + 2)
+    ]
+
+    for sigma in range(6, 6 + curves):
+        u, v = (sigma*sigma - 5) % n, 4 * sigma % n
+        X, Z = pow(u, 3, n), pow(v, 3, n)
+        denominator = 16 * X * v % n
+        try:
+            inverse = pow(denominator, -1, n)
+        except ValueError:
+            g = math.gcd(denominator, n)
+            if g != n:
+                return g
+            continue
+        a24 = pow(v - u, 3, n) * (3*u + v) * inverse % n
+
+        for k in stage1:
+            X, Z = _multiply(k, X, Z, a24, n)
+        g = math.gcd(Z, n)
+        if g == n:
+            continue
+        if g != 1:
+            return g
+
+        # stage 2: baby-step giant-step over the primes in (B1, B2]
+        odd = [(X, Z), _multiply(3, X, Z, a24, n)]
+        twice = _double(X, Z, a24, n)
+        while len(odd) < D // 4:
+            odd.append(_add(*odd[-1], *twice, *odd[-2], n))
+
+        giant = _multiply(D, X, Z, a24, n)
+        current = _multiply(first * D, X, Z, a24, n)
+        previous = _multiply((first-1) * D, X, Z, a24, n) if first > 1 else None
+        product = 1
+
+        for js in steps:
+            Xr, Zr = current
+            for j in js:
+                Xj, Zj = odd[j // 2]
+                product = product * (Xr*Zj - Xj*Zr) % n
+            if previous is None:
+                previous, current = current, _double(*current, a24, n)
+            else:
+                previous, current = current, _add(*current, *giant, *previous, n)
+
+        g = math.gcd(product, n)
+        if g not in (1, n):
+            return g
+
+    return None
+
+
+def split(n: int, use_ecm: bool = True) -> int:
+    """returns a non-trivial factor of the composite n"""
+
+    if not (n & 1):
+        return 2
+    root = math.isqrt(n)
+    if root * root == n:
+        return root
+
+    for c in range(1, 4):
+        if factor := pollard_brent(n, c, limit=1 << 16):
+            return factor
+    if use_ecm:
+        for B1, curves in ECM_ROUNDS:
+            if factor := ecm(n, B1, curves):
+                return factor
+
+    c = 4
+    while not (factor := pollard_brent(n, c)):
+        c += 1
+    return factor
+
+
+def factorize(n: int, use_ecm: bool = True) -> dict[int, int]:
+    """returns the prime factorization of n as {prime: multiplicity}
+    the factors are in increasing order"""
+
+    if not isinstance(n, int):
+        raise TypeError ("'n' must be an int")
+    if n <= 0:
+        raise ValueError ("'n' must be a positive integer")
+
+    factors = dict()
+    SIEVE.extend(TRIAL_BOUND)
+    for p in SIEVE.primes:
+        if p * p > n or p >= TRIAL_BOUND:
+            break
+        while not (n % p):
+            n //= p
+            factors[p] = factors.get(p, 0) + 1
+
+    stack = [n] if n != 1 else []
+    while stack:
+        m = stack.pop()
+        if m < TRIAL_BOUND * TRIAL_BOUND or is_probable_prime(m):
+            factors[m] = factors.get(m, 0) + 1
+            continue
+        d = split(m, use_ecm)
+        stack.extend((d, m // d))
+
+    return dict(sorted(factors.items()))
+
+
+def smallest_prime_factor(n: int, use_ecm: bool = True) -> int:
+    """returns the smallest prime factor of n > 1
+    only numbers free of small factors are factorized completely"""
+
+    SIEVE.extend(TRIAL_BOUND)
+    for p in SIEVE.primes:
+        if p * p > n:
+            return n
+        if p >= TRIAL_BOUND:
+            break
+        if not (n % p):
+            return p
+
+    if is_probable_prime(n):
+        return n
+    return next(iter(factorize(n, use_ecm)))
+
+
+def divisor_sum(n: int) -> int:
+    """returns σ(n), the sum of the positive divisors of n"""
+
+    return math.prod(
+        (pow(p, e + 1) - 1) // (p - 1) for p, e in factorize(n).items()
+    )
+
+
+def divisor_count(n: int) -> int:
+    """returns τ(n), the number of positive divisors of n"""
+
+    return math.prod(e + 1 for e in factorize(n).values())
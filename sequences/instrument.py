@@ -0,0 +1,171 @@
+"""sequences.instrument
+Contains the opt-in instrumentation of the functions of the module
+once enabled, every public function of sequences (but the iter_ factories,
+whose generators do their work after returning) is replaced by a wrapper that
+counts its calls, errors, wall time, terms returned and the term cache hits
+and misses of the lookups made during the call, in its own thread, while
+the predicates (isprime, is_palindrome, ...) count the candidates they
+examine and reject, both for themselves and for the sequence function that
+called them
+disabling puts the original functions back, so that instrumentation costs
+nothing when it is off
+predicates evaluated by the worker processes of workers= are not counted"""
+
+
+import functools
+import sys
+import threading
+import time
+from collections.abc import Callable
+
+from .cache import CACHE
+
+
+FIELDS = (
+    "calls", "errors", "seconds", "terms", "candidates", "rejected", "hits",
+    "misses",
+)
+
+
+class Instruments:
+    """the counters of the instrumented functions, keyed by function name
+    'callbacks' are called with the record of every instrumented call, a dict
+    of the function name and of the counters that call adds to"""
+
+    def __init__(self) -> None:
+        self.counters = dict()
+        self.callbacks = list()
+        self.originals = dict()
+        self.lock = threading.Lock()
+        self.local = threading.local()
+
+    @property
+    def enabled(self) -> bool:
+        """whether the functions of the module are instrumented"""
+
+        return bool(self.originals)
+
+    def enable(self) -> None:
+        """replaces every public function of the module by its instrumented
+        wrapper"""
+
+        if self.enabled:
+            return
+        namespace = vars(sys.modules[__package__])
+        for name, function in list(namespace.items()):
+            if name.startswith(("_", "iter_")) or name == "check":
+                continue
+            if getattr(function, "__module__", None) != __package__:
+                continue
+            if callable(function) and not isinstance(function, type):
+                self.originals[name] = function
+                namespace[name] = self.wrap(name, function)
+        CACHE.observer = self.observe
+
+    def disable(self) -> None:
+        """puts the original functions of the module back"""
+
+        CACHE.observer = None
+        namespace = vars(sys.modules[__package__])
+        namespace.update(self.originals)
+        self.originals.clear()
+
+    def wrap(self, name: str, function: Callable) -> Callable:
+        """returns function, counting its calls under 'name'"""
+
+        predicate = name.startswith("is_") or name == "isprime"
+
+        @functools.wraps(function)
+        def instrumented(*args, **kwargs):
+            local = self.local
+            if not hasattr(local, "callers"):
+                local.callers, local.records = list(), list()
+            callers, records = local.callers, local.records
+            # predicates called by predicates are not candidates of their own
+            nested = getattr(local, "predicate", False)
+            if predicate:
+                local.predicate = True
+            else:
+                callers.append(name)
+            record = {"name": name, "calls": 1}
+            records.append(record)
+            start = time.perf_counter()
+            try:
+                result = function(*args, **kwargs)
+            except BaseException:
+                record["errors"] = 1
+                raise
+            finally:
+                record["seconds"] = time.perf_counter() - start
+                records.pop()
+                if predicate:
+                    local.predicate = nested
+                else:
+                    callers.pop()
+                if "errors" in record:
+                    self.record(record)
+            if predicate:
+                record["candidates"] = 1
+                record["rejected"] = int(not result)
+            elif hasattr(result, "__len__") and not isinstance(result, str):
+                record["terms"] = len(result)
+            if predicate and not nested and callers:
+                self.record(record, callers[-1])
+            else:
+                self.record(record)
+            return result
+
+        return instrumented
+
+    def observe(self, kind: str) -> None:
+        """adds a term cache lookup of 'kind' (see TermCache.observer) to the
+        calls in progress in the current thread"""
+
+        field = "hits" if kind == "hits" else "misses"
+        for record in getattr(self.local, "records", ()):
+            record[field] = record.get(field, 0) + 1
+
+    def record(self, record: dict, caller: str | None = None) -> None:
+        """adds the counters of record to its function (and the candidates it
+        examined to its caller), then hands it to the callbacks"""
+
+        with self.lock:
+            counters = self.counters.setdefault(
+                record["name"], dict.fromkeys(FIELDS, 0)
+            )
+            for field in FIELDS:
+                counters[field] += record.get(field, 0)
+            if caller is not None:
+                counters = self.counters.setdefault(
+                    caller, dict.fromkeys(FIELDS, 0)
+                )
+                counters["candidates"] += record["candidates"]
+                counters["rejected"] += record["rejected"]
+        for callback in self.callbacks:
+            callback(record)
+
+    def subscribe(self, callback: Callable[[dict], None]) -> None:
+        """calls callback(record) after every instrumented call"""
+
+        self.callbacks.append(callback)
+
+    def unsubscribe(self, callback: Callable[[dict], None]) -> None:
+        """stops calling callback"""
+
+        self.callbacks.remove(callback)
+
+    def stats(self) -> dict[str, dict[str, int | float]]:
+        """returns a snapshot of the counters of every function called since
+        the last reset"""
+
+        with self.lock:
+            return {name: dict(c) for name, c in self.counters.items()}
+
+    def reset(self) -> None:
+        """sets every counter back to zero"""
+
+        with self.lock:
+            self.counters.clear()
+
+
+INSTRUMENTS = Instruments()
@@ -0,0 +1,191 @@
+"""sequences.multiplicative
+Contains the linear sieve computing tables of multiplicative functions
+    σ(n): sum of the divisors of n
+    τ(n): number of divisors of n
+    Ω(n): number of prime factors of n, counted with multiplicity
+    ω(n): number of distinct prime factors of n
+each table is stored as a compact array indexed by n, and built with NumPy
+when it is installed (by a linear sieve otherwise)"""
+
+
+import math
+import operator
+import threading
+from array import array
+from collections.abc import Iterator
+from itertools import compress, islice, repeat
+
+from .sieve import SIEVE
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class DivisorTables:
+    """σ, τ, Ω and ω for every integer below 'limit'
+    the tables are rebuilt by a linear sieve whenever they need to grow, under
+    a lock, and only swapped in (before 'limit' is raised) once complete"""
+
+    def __init__(self) -> None:
+        self.limit = 0
+        self.sigma = array("Q")
+        self.tau = array("L")
+        self.big_omega = array("B")
+        self.little_omega = array("B")
+        self.lock = threading.Lock()
+
+    def extend(self, limit: int) -> None:
+        """rebuilds the tables so that they cover every integer below limit"""
+
+        if limit <= self.limit:
+            return
+        with self.lock:
+            if limit > self.limit:
+                self.build(limit)
+
+    def build(self, limit: int) -> None:
+        """computes the tables of every integer below limit, with NumPy if it
+        is installed"""
+
+        build = linear_sieve if numpy is None else power_sieve
+        sigma, tau, big, little = build(limit)
+        self.sigma, self.tau = sigma, tau
+        self.big_omega, self.little_omega = big, little
+        self.limit = limit
+
+    def select(self, n: int, mask, estimate: int = 64) -> list[int]:
+        """returns the first n positive integers k for which the k-th item of
+        mask(self) is truthy (mask(self) starts at k = 1)
+        the tables grow until n such integers are found"""
+
+        limit = estimate
+        while True:
+            self.extend(limit)
+            numbers = list(
+                islice(compress(range(1, self.limit), mask(self)), n)
+            )
+            if len(numbers) == n:
+                return numbers
+            ratio = max(1.25, 1.1 * n / max(len(numbers), 1))
+            limit = int(self.limit * ratio)
+
+    def iterate(self, mask, estimate: int = 64) -> Iterator[int]:
+        """yields every positive integer k for which the k-th item of
+        mask(self) is truthy, doubling the tables whenever they run out"""
+
+        start = 1
+        self.extend(estimate)
+        while True:
+            end = self.limit
+            marks = islice(mask(self), start - 1, None)
+            yield from compress(range(start, end), marks)
+            start = end
+            self.extend(2 * end)
+
+
+def linear_sieve(N: int) -> tuple[array, array, array, array]:
+    """returns the tables σ, τ, Ω and ω of every integer below N, built by a
+    linear sieve"""
+
+    spf, power = array("L", [0]) * N, array("Q", [0]) * N
+    sigma, tau = array("Q", [0]) * N, array("L", [0]) * N
+    big, little = array("B", [0]) * N, array("B", [0]) * N
+    primes = list()
+
+    if N > 1:
+        sigma[1] = tau[1] = power[1] = 1
+
+    # every composite j = i * p is visited exactly once, with p = spf(j)
+    for i in range(2, N):
+        if not spf[i]:
+            spf[i] = power[i] = i
+            primes.append(i)
+            sigma[i], tau[i], big[i], little[i] = i + 1, 2, 1, 1
+
+        smallest = spf[i]
+        top = min(smallest, (N - 1) // i)
+        s, t, b, w = sigma[i], tau[i], big[i] + 1, little[i]
+
+        for p in primes:
+            if p > top:
+                break
+            j = i * p
+            spf[j], big[j] = p, b
+            if p == smallest:
+                q = power[i]
+                rest = i // q
+                power[j], little[j] = q * p, w
+                sigma[j] = sigma[rest] * (q*p*p - 1) // (p - 1)
+                tau[j] = t + tau[rest]
+            else:
+                power[j], little[j] = p, w + 1
+                sigma[j], tau[j] = s * (p + 1), 2 * t
+
+    return sigma, tau, big, little
+
+
+def power_sieve(N: int) -> tuple[array, array, array, array]:
+    """returns the tables σ, τ, Ω and ω of every integer below N, with NumPy
+    every power pᵉ of a prime p ≤ √N is divided out of its multiples, which
+    raises their factor of σ from 1 + ... + pᵉ⁻¹ to 1 + ... + pᵉ and of τ
+    from e to e + 1; what is left of each integer is then 1 or a prime"""
+
+    rest = numpy.arange(N, dtype=numpy.uint64)
+    sigma, tau = numpy.ones(N, numpy.uint64), numpy.ones(N, numpy.uint64)
+    big, little = numpy.zeros(N, numpy.uint8), numpy.zeros(N, numpy.uint8)
+
+    SIEVE.extend(math.isqrt(N) + 2)
+    for p in SIEVE.primes:
+        if p * p >= N:
+            break
+        little[p::p] += 1
+        q, e, before, after = p, 1, 1, 1 + p
+        while q < N:
+            big[q::q] += 1
+            rest[q::q] //= p
+            sigma[q::q] = sigma[q::q] // before * after
+            tau[q::q] = tau[q::q] // e * (e + 1)
+            q, e = q * p, e + 1
+            before, after = after, after + q
+
+    large = rest > 1
+    big[large] += 1
+    little[large] += 1
+    sigma[large] *= rest[large] + 1
+    tau[large] *= 2
+    sigma[0] = tau[0] = 0
+
+    return (
+        compact("Q", sigma), compact("L", tau),
+        compact("B", big), compact("B", little),
+    )
+
+
+def compact(code: str, values) -> array:
+    """returns the NumPy array values as an array of the given typecode"""
+
+    table = array(code)
+    table.frombytes(values.astype(f"u{table.itemsize}").tobytes())
+    return table
+
+
+def arithmetic_mask(t: DivisorTables):
+    """marks every x such that τ(x) divides σ(x)"""
+    return map(operator.not_, map(operator.mod, t.sigma[1:], t.tau[1:]))
+
+
+def semiprime_mask(t: DivisorTables):
+    """marks every x such that Ω(x) = 2"""
+    return map((2).__eq__, t.big_omega[1:])
+
+
+def sphenic_mask(t: DivisorTables):
+    """marks every x such that Ω(x) = ω(x) = 3"""
+    return map(
+        operator.eq, zip(t.big_omega[1:], t.little_omega[1:]), repeat((3, 3))
+    )
+
+
+TABLES = DivisorTables()
@@ -0,0 +1,65 @@
+"""sequences.parallel
+Contains the parallel range-scan engine behind the filter-style sequences
+consecutive blocks of candidates are tested by a pool of worker processes, and
+their hits are merged back in order until enough of them are found
+the test must be a module-level function, so that it can be sent to the
+workers"""
+
+
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+
+
+# one pool per number of workers, kept alive between calls
+POOLS = dict()
+
+CHUNK = 1 << 12
+MAX_CHUNK = 1 << 18
+
+
+def search(test: Callable[[int], bool], low: int, high: int) -> list[int]:
+    """returns every x in range(low, high) such that test(x)"""
+
+    return list(filter(test, range(low, high)))
+
+
+def pool(workers: int) -> ProcessPoolExecutor:
+    """returns the shared pool of 'workers' processes"""
+
+    if workers not in POOLS:
+        POOLS[workers] = ProcessPoolExecutor(workers)
+    return POOLS[workers]
+
+
+def scan(
+    test: Callable[[int], bool], n: int, start: int, workers: int,
+    chunk: int = CHUNK, max_chunk: int = MAX_CHUNK,
+) -> list[int]:
+    """returns the first n integers x ≥ start such that test(x), testing
+    blocks of 'chunk' to 'max_chunk' candidates on 'workers' processes
+    the blocks grow as the hits thin out, and 2 * workers of them are kept in
+    flight; the ones still pending once n hits are found are cancelled"""
+
+    executor, pending, hits = pool(workers), deque(), list()
+    low = start
+
+    def submit():
+        nonlocal low
+        pending.append(executor.submit(search, test, low, low + chunk))
+        low += chunk
+
+    for _ in range(2 * workers):
+        submit()
+
+    while len(hits) < n:
+        found = pending.popleft().result()
+        hits.extend(found)
+        # fewer than one hit per block per worker: make the blocks longer
+        if len(found) < workers:
+            chunk = min(2 * chunk, max_chunk)
+        submit()
+
+    for future in pending:
+        future.cancel()
+    return hits[:n]
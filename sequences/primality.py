@@ -0,0 +1,159 @@
+"""sequences.primality
+Contains the Miller-Rabin and Baillie-PSW primality tests used by isprime
+Miller-Rabin is deterministic below 2⁶⁴ and Baillie-PSW is used above it
+Mersenne numbers have the dedicated Lucas-Lehmer test, and repunits a sieve
+of their possible factors"""
+
+
+import math
+
+
+SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47)
+
+# Jim Sinclair's bases, deterministic for every n < 2⁶⁴
+BASES_64 = (2, 325, 9375, 28178, 450775, 9780504, 1795265022)
+
+# how many candidate factors 2kp + 1 of 2ᵖ - 1 are tried before Lucas-Lehmer
+MERSENNE_TRIAL = 1000
+
+# how many candidate factors 2kp + 1 of (10ᵖ - 1) / 9 are tried before BPSW
+REPUNIT_TRIAL = 2000
+
+
+def miller_rabin(n: int, bases: tuple[int, ...]) -> bool:
+    """returns True if odd n > 2 is a strong probable prime to every base"""
+
+    d, s = n - 1, 0
+    while not (d & 1):
+        d >>= 1
+        s += 1
+
+    for a in bases:
+        a %= n
+        if a in (0, 1, n-1):
+            continue
+        x = pow(a, d, n)
+        if x in (1, n-1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def jacobi(a: int, n: int) -> int:
+    """returns the Jacobi symbol (a/n) for odd positive n"""
+
+    a, result = a % n, 1
+    while a:
+        while not (a & 1):
+            a >>= 1
+            if n % 8 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a % 4 == 3 and n % 4 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+
+def strong_lucas(n: int) -> bool:
+    """returns True if odd n > 2 is a strong Lucas probable prime with the
+    parameters chosen by Selfridge's method A"""
+
+    if math.isqrt(n) ** 2 == n:
+        return False
+
+    D = 5
+    while (j := jacobi(D, n)) != -1:
+        if j == 0 and abs(D) != n:
+            return False
+        D = -D - 2 if D > 0 else -D + 2
+    P, Q = 1, (1 - D) // 4
+
+    d, s = n + 1, 0
+    while not (d & 1):
+        d >>= 1
+        s += 1
+
+    U, V, Qk = 1, P, Q % n
+    for bit in bin(d)[3:]:
+        U, V = U * V % n, (V*V - 2*Qk) % n
+        Qk = Qk * Qk % n
+        if bit == "1":
+            U, V = P*U + V, D*U + P*V
+            U = ((U + n) if U & 1 else U) // 2 % n
+            V = ((V + n) if V & 1 else V) // 2 % n
+            Qk = Qk * Q % n
+
+    if not (U and V):
+        return True
+    for _ in range(s - 1):
+        V = (V*V - 2*Qk) % n
+        if not V:
+            return True
+        Qk = Qk * Qk % n
+    return False
+
+
+def is_probable_prime(n: int) -> bool:
+    """returns True if n is prime
+    the answer is exact for n < 2⁶⁴, and no Baillie-PSW pseudoprime above that
+    is known"""
+
+    if n < 2:
+        return False
+    for p in SMALL_PRIMES:
+        if not (n % p):
+            return n == p
+
+    if n < 2209:
+        return True
+    if n < 1 << 64:
+        return miller_rabin(n, BASES_64)
+    return miller_rabin(n, (2,)) and strong_lucas(n)
+
+
+def lucas_lehmer(p: int) -> bool:
+    """returns True if the Mersenne number 2ᵖ - 1 is prime, for prime p
+    the squares are reduced mod 2ᵖ - 1 with shifts and masks, as
+    x ≡ (x & (2ᵖ - 1)) + (x >> p)"""
+
+    if p == 2:
+        return True
+
+    mersenne = (1 << p) - 1
+    # every factor of 2ᵖ - 1 is of the form 2kp + 1, and ≡ ±1 (mod 8)
+    for k in range(1, MERSENNE_TRIAL):
+        q = 2*k*p + 1
+        if q >= mersenne:
+            break
+        if q % 8 in (1, 7) and pow(2, p, q) == 1:
+            return False
+
+    s = 4
+    for _ in range(p - 2):
+        s = s*s - 2
+        s = (s & mersenne) + (s >> p)
+        if s >= mersenne:
+            s -= mersenne
+    return s == 0
+
+
+def is_repunit_prime(p: int) -> bool:
+    """returns True if the repunit (10ᵖ - 1) / 9 is prime, for prime p"""
+
+    repunit = (pow(10, p) - 1) // 9
+    if p > 3:
+        # every factor of the repunit is of the form 2kp + 1, and any such q
+        # with 10ᵖ ≡ 1 (mod q) shares a proper factor with it
+        for k in range(1, REPUNIT_TRIAL):
+            q = 2*k*p + 1
+            if q >= repunit:
+                break
+            if pow(10, p, q) == 1:
+                return False
+    return is_probable_prime(repunit)
@@ -0,0 +1,89 @@
+"""sequences.recurrence
+Contains the engine behind the linear recurrences of the module
+    Tₙ = c₁Tₙ₋₁ + c₂Tₙ₋₂ + ... + cₐTₙ₋ₐ
+single terms are computed in O(log n) arithmetic operations by fast
+doubling or companion-matrix exponentiation"""
+
+
+import operator
+
+
+class LinearRecurrence:
+    """a linear recurrence with constant integer coefficients
+    'coefficients' are (c₁, c₂, ..., cₐ) and 'initial' are
+    (T₀, T₁, ..., Tₐ₋₁)"""
+
+    def __init__(self, coefficients: tuple[int, ...], initial: tuple[int, ...]):
+        if len(coefficients) != len(initial):
+            raise ValueError ("need exactly one initial term per coefficient")
+        self.coefficients = tuple(coefficients)
+        self.initial = tuple(initial)
+
+    def nth(self, k: int, modulus: int | None = None) -> int:
+        """returns Tₖ, reduced modulo 'modulus' if it is given"""
+
+        if k < len(self.initial):
+            term = self.initial[k]
+        elif self.coefficients == (1, 1):
+            a, b = self.initial
+            f, g = fast_doubling(k, modulus)
+            term = a*f + b*g
+        else:
+            term = sum(map(
+                operator.mul, self.initial, companion_power(
+                    self.coefficients, k - len(self.initial) + 1, modulus
+                )
+            ))
+        return term if modulus is None else term % modulus
+
+
+def fast_doubling(k: int, modulus: int | None = None) -> tuple[int, int]:
+    """returns (Fₖ₋₁, Fₖ) for k ≥ 0, where Fₖ is the k-th Fibonacci number
+    F₂ₖ = Fₖ(2Fₖ₊₁ - Fₖ) and F₂ₖ₊₁ = Fₖ² + Fₖ₊₁²"""
+
+    a, b = 0, 1
+    for bit in bin(k)[2:]:
+        a, b = a * (2*b - a), a*a + b*b
+        if bit == "1":
+            a, b = b, a + b
+        if modulus is not None:
+            a, b = a % modulus, b % modulus
+    # (a, b) = (Fₖ, Fₖ₊₁)
+    previous = b - a
+    return previous if modulus is None else previous % modulus, a
+
+
+def multiply(A: list[list[int]], B: list[list[int]], modulus: int | None):
+    """returns the matrix product AB, reduced modulo 'modulus' if given"""
+
+    columns = list(zip(*B))
+    product = [
+        [sum(map(operator.mul, row, column)) for column in columns] for row in A
+    ]
+    if modulus is not None:
+        product = [[x % modulus for x in row] for row in product]
+    return product
+
+
+def companion_power(
+    coefficients: tuple[int, ...], k: int, modulus: int | None = None
+) -> list[int]:
+    """returns the weights (w₀, w₁, ..., wₐ₋₁) such that
+    Tₐ₋₁₊ₖ = w₀T₀ + w₁T₁ + ... + wₐ₋₁Tₐ₋₁
+    by raising the companion matrix of the recurrence to the k-th power"""
+
+    d = len(coefficients)
+    # maps (Tₙ, Tₙ₋₁, ..., Tₙ₋ₐ₊₁) to (Tₙ₊₁, Tₙ, ..., Tₙ₋ₐ₊₂)
+    matrix = [list(coefficients)] + [
+        [int(j == i) for j in range(d)] for i in range(d - 1)
+    ]
+    result = [[int(i == j) for j in range(d)] for i in range(d)]
+
+    while k:
+        if k & 1:
+            result = multiply(result, matrix, modulus)
+        matrix = multiply(matrix, matrix, modulus)
+        k >>= 1
+
+    # the top row expresses Tₐ₋₁₊ₖ in terms of (Tₐ₋₁, ..., T₀)
+    return result[0][::-1]
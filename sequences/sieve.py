@@ -0,0 +1,95 @@
+"""sequences.sieve
+Contains the segmented Sieve of Eratosthenes shared by every prime-dependent
+sequence of the module
+the sieve grows on demand and keeps the primes it has found between calls"""
+
+
+import math
+import threading
+from array import array
+from bisect import bisect_left
+from itertools import compress
+
+
+class PrimeSieve:
+    """an incrementally grown, segmented Sieve of Eratosthenes
+    all primes below 'limit' are known and stored in 'primes'
+    the sieve only grows under its lock, and 'limit' is only raised once the
+    primes below it are stored, so that threads can share it"""
+
+    def __init__(self, segment: int = 1 << 18) -> None:
+        self.segment = segment
+        self.primes = array("Q", [2, 3, 5, 7])
+        self.limit = 10
+        self.lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.primes)
+
+    def __iter__(self):
+        """yields every prime in increasing order, growing the sieve as needed"""
+
+        index = 0
+        while True:
+            while index < len(self.primes):
+                yield self.primes[index]
+                index += 1
+            self.extend(2 * self.limit)
+
+    def extend(self, limit: int) -> None:
+        """sieves segment by segment until all primes below limit are known"""
+
+        if limit <= self.limit:
+            return
+
+        with self.lock:
+            primes = self.primes
+            while self.limit < limit:
+                low = self.limit
+                high = min(limit, low + self.segment, low * low)
+                size = high - low
+                segment = bytearray(b"\x01") * size
+
+                for p in primes:
+                    if p * p >= high:
+                        break
+                    start = max(p * p, -(-low // p) * p) - low
+                    if start < size:
+                        segment[start::p] = bytes((size - 1 - start) // p + 1)
+
+                primes.extend(array("Q", compress(range(low, high), segment)))
+                self.limit = high
+
+    def bound(self, n: int) -> int:
+        """returns an upper bound for the n-th prime (Rosser's theorem)"""
+
+        if n < 6:
+            return 12
+        log = math.log(n)
+        return int(n * (log + math.log(log))) + 1
+
+    def first(self, n: int) -> list[int]:
+        """returns the first n primes"""
+
+        if len(self.primes) < n:
+            self.extend(self.bound(n) + 1)
+        return self.primes[:n].tolist()
+
+    def below(self, limit: int) -> list[int]:
+        """returns every prime strictly less than limit"""
+
+        self.extend(limit)
+        return self.primes[:bisect_left(self.primes, limit)].tolist()
+
+    def isprime(self, n: int) -> bool:
+        """returns True if n is prime, sieving up to n if needed"""
+
+        if n < 2:
+            return False
+        if n >= self.limit:
+            self.extend(max(n + 1, self.limit + self.segment))
+        index = bisect_left(self.primes, n)
+        return index < len(self.primes) and self.primes[index] == n
+
+
+SIEVE = PrimeSieve()
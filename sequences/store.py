@@ -0,0 +1,247 @@
+"""sequences.store
+Contains the persistent, on-disk store of the terms of the costly sequences
+each sequence is saved in its own file <name>.seq in the store's directory
+    header: magic b"SEQT", version (u16), width (u16), count (u64), size
+            (u64), the number of bytes of the terms after the header
+    width 8: count little-endian int64 terms
+    width 0: count terms, each a u32 byte length followed by the term as a
+             signed little-endian integer of that many bytes
+files are read through mmap, so that processes share the pages; a longer
+prefix is appended to its file, the header being updated once the new terms
+are written, and the file is only replaced (atomically) when its terms no
+longer fit its width
+the store is disabled unless a directory is given, either through the
+SEQUENCES_STORE environment variable or with STORE.open(directory)"""
+
+
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import threading
+from array import array
+from collections.abc import Callable
+
+try:
+    import fcntl
+except ImportError:
+    # no advisory locks: processes appending to the same file at once may
+    # lose some of their terms
+    fcntl = None
+
+
+MAGIC = b"SEQT"
+VERSION = 2
+HEADER = struct.Struct("<4sHHQQ")
+LENGTH = struct.Struct("<I")
+INT64 = range(-(1 << 63), 1 << 63)
+
+
+class TermStore:
+    """the on-disk prefixes of the sequences, one file per sequence
+    the maps are only used and closed under 'lock', so that no thread closes
+    a map another one is reading"""
+
+    def __init__(self, directory: str | None = None) -> None:
+        self.directory = None
+        self.maps = dict()
+        self.lock = threading.RLock()
+        if directory is not None:
+            self.open(directory)
+
+    def open(self, directory: str) -> None:
+        """enables the store, keeping its files in directory"""
+
+        with self.lock:
+            self.close()
+            os.makedirs(directory, exist_ok=True)
+            self.directory = directory
+
+    def close(self) -> None:
+        """disables the store and unmaps its files"""
+
+        with self.lock:
+            for mapped in self.maps.values():
+                mapped.close()
+            self.maps.clear()
+            self.directory = None
+
+    def file(self, name: str) -> str:
+        """returns the path of the file of the sequence 'name'"""
+
+        return os.path.join(self.directory, f"{name}.seq")
+
+    def map(self, name: str) -> mmap.mmap | None:
+        """returns the memory map of the file of 'name', or None if there is
+        no such file or it was written by another version of the store"""
+
+        if name not in self.maps:
+            try:
+                with open(self.file(name), "rb") as file:
+                    mapped = mmap.mmap(
+                        file.fileno(), 0, access=mmap.ACCESS_READ
+                    )
+            except (FileNotFoundError, ValueError):
+                return None
+            if len(mapped) < HEADER.size:
+                mapped.close()
+                return None
+            if HEADER.unpack_from(mapped)[:2] != (MAGIC, VERSION):
+                mapped.close()
+                return None
+            self.maps[name] = mapped
+        return self.maps[name]
+
+    def unmap(self, name: str) -> None:
+        """closes the memory map of the file of 'name', so that it is mapped
+        again, with the terms appended since, when next read"""
+
+        with self.lock:
+            if name in self.maps:
+                self.maps.pop(name).close()
+
+    def count(self, name: str) -> int:
+        """returns the number of stored terms of the sequence 'name'"""
+
+        with self.lock:
+            if self.directory is None or (mapped := self.map(name)) is None:
+                return 0
+            return HEADER.unpack_from(mapped)[3]
+
+    def read(self, name: str, n: int) -> list[int]:
+        """returns the (at most n) stored terms of the sequence 'name'"""
+
+        with self.lock:
+            if self.directory is None or (mapped := self.map(name)) is None:
+                return list()
+            _, _, width, count, size = HEADER.unpack_from(mapped)
+            # another process may have appended to the file since it was
+            # mapped, the header then counts terms past the end of the map
+            offset, end = HEADER.size, min(HEADER.size + size, len(mapped))
+
+            if width:
+                if not (n := min(n, count, (end - offset) // 8)):
+                    return list()
+                if sys.byteorder == "little":
+                    # the terms are converted straight out of the mapped pages
+                    with memoryview(mapped) as view:
+                        with view[offset : offset + 8*n].cast("q") as cells:
+                            return cells.tolist()
+                terms = array("q", mapped[offset : offset + 8*n])
+                terms.byteswap()
+                return terms.tolist()
+
+            terms = list()
+            for _ in range(min(n, count)):
+                if offset + LENGTH.size > end:
+                    break
+                (length,) = LENGTH.unpack_from(mapped, offset)
+                offset += LENGTH.size
+                if offset + length > end:
+                    break
+                data = mapped[offset : offset + length]
+                terms.append(int.from_bytes(data, "little", signed=True))
+                offset += length
+            return terms
+
+    def write(self, name: str, terms: list[int]) -> None:
+        """saves terms as the prefix of the sequence 'name', appending the
+        terms past the stored ones to its file"""
+
+        with self.lock:
+            if self.directory is None or len(terms) <= self.count(name):
+                return
+            self.unmap(name)
+            try:
+                file = open(self.file(name), "r+b")
+            except FileNotFoundError:
+                self.replace(name, terms)
+                return
+
+            with file:
+                if fcntl is not None:
+                    # released when the file is closed
+                    fcntl.flock(file, fcntl.LOCK_EX)
+                header = file.read(HEADER.size)
+                if len(header) < HEADER.size:
+                    self.replace(name, terms)
+                    return
+                magic, version, width, count, size = HEADER.unpack(header)
+                if (magic, version) != (MAGIC, VERSION):
+                    self.replace(name, terms)
+                    return
+                if len(terms) <= count:
+                    # another process got there first
+                    return
+                new = terms[count:]
+                if width and not all(term in INT64 for term in new):
+                    self.replace(name, terms)
+                    return
+
+                body = pack(new, width)
+                file.seek(HEADER.size + size)
+                file.write(body)
+                file.truncate()
+                file.flush()
+                # the terms are only counted once they are all written
+                file.seek(0)
+                file.write(HEADER.pack(
+                    MAGIC, VERSION, width, len(terms), size + len(body)
+                ))
+
+    def replace(self, name: str, terms: list[int]) -> None:
+        """saves terms as the whole content of the file of 'name', replacing
+        it atomically"""
+
+        width = 8 if all(term in INT64 for term in terms) else 0
+        body = pack(terms, width)
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory)
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(HEADER.pack(
+                    MAGIC, VERSION, width, len(terms), len(body)
+                ))
+                file.write(body)
+            with self.lock:
+                self.unmap(name)
+                os.replace(temporary, self.file(name))
+        finally:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+
+    def fetch(self, name: str, n: int, compute: Callable[[int], list[int]]):
+        """returns the first n terms of the sequence 'name' from the store, or
+        from compute(n) if not enough of them are stored, saving them back"""
+
+        terms = self.read(name, n)
+        if len(terms) < n:
+            # another process may have grown the file since it was mapped
+            self.unmap(name)
+            terms = self.read(name, n)
+        if len(terms) < n:
+            terms = compute(n)
+            self.write(name, terms)
+        return terms
+
+
+def pack(terms: list[int], width: int) -> bytes:
+    """returns the bytes of terms in the file format of the given width"""
+
+    if width:
+        body = array("q", terms)
+        if sys.byteorder == "big":
+            body.byteswap()
+        return body.tobytes()
+    return b"".join(
+        LENGTH.pack(len(data)) + data for data in map(encode, terms)
+    )
+
+
+def encode(term: int) -> bytes:
+    """returns term as a signed little-endian integer of the fewest bytes"""
+
+    return term.to_bytes(term.bit_length() // 8 + 1, "little", signed=True)
+
+
+STORE = TermStore(os.environ.get("SEQUENCES_STORE"))
@@ -0,0 +1,43 @@
+"""sequences.transform
+Contains lazy, single-pass views of the sequences of the module
+each transform takes an iterable of terms (e.g. iter_fibonacci()) and returns
+an iterator, so transforms can be chained without recomputing the base terms
+example:
+    alternate(iter_fibonacci(), -1) -> 0, 1, -1, 2, -3, 5, ..."""
+
+
+import operator
+from collections.abc import Iterable, Iterator
+from itertools import chain, cycle, islice, repeat
+
+
+def alternate(terms: Iterable[int], first: int = 1) -> Iterator[int]:
+    """yields the terms with alternating signs, the first one multiplied by
+    'first' (1 or -1), the second by -first, and so on"""
+
+    return map(operator.mul, terms, cycle((first, -first)))
+
+
+def scale(terms: Iterable[int], factor: int) -> Iterator[int]:
+    """yields every term multiplied by 'factor'"""
+
+    return map(operator.mul, terms, repeat(factor))
+
+
+def translate(terms: Iterable[int], amount: int) -> Iterator[int]:
+    """yields every term increased by 'amount'"""
+
+    return map(operator.add, terms, repeat(amount))
+
+
+def offset(terms: Iterable[int], k: int) -> Iterator[int]:
+    """yields the terms starting from the k-th one (counting from 0)"""
+
+    return islice(terms, k, None)
+
+
+def interleave(*sequences: Iterable[int]) -> Iterator[int]:
+    """yields the first term of each sequence, then the second term of each
+    sequence, and so on, stopping when the shortest sequence is exhausted"""
+
+    return chain.from_iterable(zip(*sequences))
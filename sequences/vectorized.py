@@ -0,0 +1,100 @@
+"""sequences.vectorized
+Contains the NumPy backend of the polynomial (figurate) sequences of the module
+all n terms are evaluated at once from their closed forms as an int64 array,
+falling back to an array of Python ints when int64 would overflow
+the 2-automatic sequences (Baum-Sweet, Gould) are filled in by doubling
+blocks, each term of [m, 2m) being read from the block [m/4, m) before it
+NumPy is optional: it is only needed when these functions are called"""
+
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+INT64_MAX = (1 << 63) - 1
+
+
+def require(function: str, n: int) -> None:
+    """checks that NumPy is installed and that n is a positive int"""
+
+    if numpy is None:
+        raise ImportError (f"{function}() requires NumPy, pip install numpy")
+    if not isinstance(n, int):
+        raise TypeError ("'n' must be an int")
+    if n <= 0:
+        raise ValueError ("'n' must be a positive integer")
+
+
+# name: (index of the first term, closed form valid for ints and int arrays)
+# every intermediate product is at most 6 times the term it yields
+FIGURATE = {
+    "square": (0, lambda i: i * i),
+    "cube": (0, lambda i: i * i * i),
+    "triangular": (1, lambda i: i * (i+1) // 2),
+    "tetrahedral": (1, lambda i: i * (i+1) * (i+2) // 6),
+    "octahedral": (1, lambda i: i * (2*i*i + 1) // 3),
+    "dodecahedral": (1, lambda i: i * (3*i - 1) * (3*i - 2) // 2),
+    "icosahedral": (1, lambda i: i * (5*i*i - 5*i + 2) // 2),
+    "sq_pyramid": (1, lambda i: i * (i+1) * (2*i + 1) // 6),
+    "star": (1, lambda i: 6*i * (i-1) + 1),
+    "stella_octangula": (0, lambda i: i * (2*i*i - 1)),
+    "central_polygon": (0, lambda i: (i*i + i + 2) // 2),
+    "magic_constants": (0, lambda i: i * (i*i + 1) // 2),
+    "pronic": (0, lambda i: i * (i+1)),
+}
+
+
+def figurate(name: str, n: int):
+    """returns the first n terms of the figurate sequence 'name' as a NumPy
+    array, of dtype int64 if every term (and every intermediate product) fits
+    in it, and of dtype object holding Python ints otherwise
+    'name' is one of the keys of FIGURATE"""
+
+    require("figurate", n)
+    if name not in FIGURATE:
+        raise ValueError (f"'{name}' is not a figurate sequence")
+
+    start, formula = FIGURATE[name]
+    # every closed form is increasing in i, so the last term is the largest
+    if formula(start + n - 1) > INT64_MAX // 8:
+        return numpy.array(
+            [formula(i) for i in range(start, start + n)], dtype=object
+        )
+    return formula(numpy.arange(start, start + n, dtype=numpy.int64))
+
+
+def baum_sweet_array(n: int):
+    """returns the first n terms of the Baum-Sweet Sequence as a NumPy uint8
+    array, using T(2k + 1) = T(k), T(4k) = T(k) and T(4k + 2) = 0"""
+
+    require("baum_sweet_array", n)
+    terms = numpy.zeros(max(n, 4), dtype=numpy.uint8)
+    terms[:4] = (1, 1, 0, 1)
+    m = 4
+    while m < n:
+        end = min(2 * m, n)
+        terms[m + 1 : end : 2] = terms[m // 2 : m // 2 + (end - m) // 2]
+        terms[m : end : 4] = terms[m // 4 : m // 4 + (end - m + 3) // 4]
+        m *= 2
+    return terms[:n]
+
+
+def gould_array(n: int):
+    """returns the first n terms of the Gould Sequence, 2^popcount(i) for i
+    in [1, n], as a NumPy array of the smallest unsigned dtype holding them,
+    using G(2k) = G(k) and G(2k + 1) = 2G(k)"""
+
+    require("gould_array", n)
+    dtype = numpy.min_scalar_type(1 << n.bit_length())
+    terms = numpy.ones(max(n + 1, 2), dtype=dtype)
+    terms[1] = 2
+    m = 2
+    while m <= n:
+        end = min(2 * m, n + 1)
+        half = terms[m // 2 : m // 2 + (end - m + 1) // 2]
+        terms[m : end : 2] = half
+        terms[m + 1 : end : 2] = 2 * half[: (end - m) // 2]
+        m *= 2
+    return terms[1 : n + 1]
@@ -5,13 +5,15 @@ with open("README.md", "r") as fh:
 
 setuptools.setup(
     name="sequences",
-    version="0.0.8",
+    version="0.0.9",
     author="Divyajeet Singh",
     author_email="knightt1821@gmail.com",
     description="provides the most famous of sequences of the OEIS",
     long_description=long_desc,
     long_description_content_type="text/markdown",
     packages=setuptools.find_packages(),
+    python_requires=">=3.10",
+    extras_require={"numpy": ["numpy"]},
     url="https://github.com/divyajeettt/sequences",
     classifiers=[
         "Programming Language :: Python :: 3",
@@ -0,0 +1,104 @@
+"""tests of sequences.aio, the asyncio facade"""
+
+
+import asyncio
+import time
+
+import pytest
+
+import sequences
+from sequences import aio
+
+
+@pytest.fixture(autouse=True)
+def workers():
+    aio.configure(2)
+    yield
+    aio.configure()
+
+
+def test_call():
+    async def main():
+        return await aio.prime(100), await aio.look_say(5, kind=str)
+
+    assert asyncio.run(main()) == (
+        sequences.prime(100), sequences.look_say(5, str)
+    )
+
+
+def test_errors_are_raised():
+    async def main():
+        await aio.prime(-1)
+
+    with pytest.raises(ValueError):
+        asyncio.run(main())
+    with pytest.raises(AttributeError):
+        aio.iter_prime
+    with pytest.raises(AttributeError):
+        aio.nonexistent
+
+
+def test_identical_requests_are_shared():
+    async def main():
+        tasks = [asyncio.ensure_future(aio.prime(10**4)) for _ in range(5)]
+        await asyncio.sleep(0)
+        assert len(aio.INFLIGHT) == 1
+        results = await asyncio.gather(*tasks)
+        assert not aio.INFLIGHT
+        return results
+
+    results = asyncio.run(main())
+    assert all(result == sequences.prime(10**4) for result in results)
+
+
+def test_cancel_kills_the_worker():
+    async def main():
+        aio.configure(1)
+        # far too long to ever finish
+        task = asyncio.ensure_future(aio.euclid_mullin(40))
+        await asyncio.sleep(0.5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert not aio.INFLIGHT
+        start = time.perf_counter()
+        terms = await aio.fibonacci(10)
+        return terms, time.perf_counter() - start
+
+    terms, seconds = asyncio.run(main())
+    assert terms == sequences.fibonacci(10)
+    assert seconds < 10
+
+
+def test_one_cancelled_caller_does_not_cancel_the_others():
+    async def main():
+        first = asyncio.ensure_future(aio.prime(10**5))
+        second = asyncio.ensure_future(aio.prime(10**5))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(main()) == sequences.prime(10**5)
+
+
+def test_stream():
+    async def main():
+        chunks = list()
+        async for terms in aio.stream("fibonacci", 7):
+            chunks.append(terms)
+            if len(chunks) == 5:
+                break
+        return chunks
+
+    chunks = asyncio.run(main())
+    assert [len(terms) for terms in chunks] == [7] * 5
+    assert sum(chunks, []) == sequences.fibonacci(35)
+
+
+def test_stream_rejects_other_names():
+    async def main():
+        async for _ in aio.stream("isprime"):
+            pass
+
+    with pytest.raises(ValueError):
+        asyncio.run(main())
@@ -0,0 +1,56 @@
+"""tests of batch and of the SEQUENCES registry"""
+
+
+import inspect
+
+import pytest
+
+import sequences
+
+
+def test_registry():
+    for name in sequences.SEQUENCES:
+        function = getattr(sequences, name)
+        assert inspect.isfunction(function)
+        assert next(iter(inspect.signature(function).parameters)) == "n"
+    for name in ("isprime", "nth", "batch", "check", "baum_sweet_array"):
+        assert name not in sequences.SEQUENCES
+
+
+def test_batch_matches_the_functions():
+    requests = [
+        ("fibonacci", 30), ("lucas", 50), ("negafibonacci", 7),
+        ("negalucas", 12), ("prime", 1000), ("prime_powers", 300),
+        ("composite", 200), ("semiprime", 500), ("sphenic", 100),
+        ("arithmetic", 400), ("catalan", 20), ("fibonacci", 3),
+    ]
+    expected = [getattr(sequences, name)(n) for name, n in requests]
+    assert sequences.batch(requests) == expected
+
+
+def test_batch_pascal_rows():
+    assert sequences.batch([("pascal", 3), ("pascal", 5), ("pascal", 3)]) == [
+        [1, 3, 3, 1], [1, 5, 10, 10, 5, 1], [1, 3, 3, 1],
+    ]
+
+
+def test_batch_results_are_independent():
+    first, second = sequences.batch([("fibonacci", 5), ("fibonacci", 5)])
+    first.append(None)
+    assert second == [0, 1, 1, 2, 3]
+
+
+@pytest.mark.parametrize("name", [
+    "iter_prime", "is_palindrome", "isprime", "ordinal", "check", "nope",
+    "gould_array",
+])
+def test_batch_rejects_other_names(name):
+    with pytest.raises(ValueError):
+        sequences.batch([(name, 3)])
+
+
+def test_batch_checks_n():
+    with pytest.raises(ValueError):
+        sequences.batch([("prime", 0)])
+    with pytest.raises(TypeError):
+        sequences.batch([("prime", 2.0)])
@@ -0,0 +1,62 @@
+"""tests of sequences.binomial"""
+
+
+import math
+from itertools import islice
+
+import sequences
+from sequences import binomial
+
+
+PRIMES = [2, 3, 5, 7, 13, 101]
+
+
+def test_row():
+    for n in range(60):
+        assert list(binomial.row(n)) == [math.comb(n, r) for r in range(n+1)]
+        assert binomial.full_row(n) == list(binomial.row(n))
+
+
+def test_row_slices():
+    n = 40
+    for start in range(0, n + 3, 3):
+        for stop in range(start, n + 4, 5):
+            expected = [math.comb(n, r) for r in range(start, min(stop, n+1))]
+            assert list(binomial.row(n, start, stop)) == expected
+
+
+def test_row_mod():
+    for p in PRIMES:
+        # past p² the rows have three base p digits
+        for n in range(min(3 * p * p + 5, 400)):
+            expected = [math.comb(n, r) % p for r in range(n + 1)]
+            assert list(binomial.row_mod(n, p)) == expected
+
+
+def test_row_mod_slices():
+    n = 1000
+    for p in PRIMES:
+        for start, stop in ((0, 10), (7, 400), (333, 1001), (999, 5000)):
+            expected = [
+                math.comb(n, r) % p for r in range(start, min(stop, n + 1))
+            ]
+            assert list(binomial.row_mod(n, p, start, stop)) == expected
+
+
+def test_central_and_catalan():
+    assert list(islice(binomial.central(), 100)) == [
+        math.comb(2*n, n) for n in range(100)
+    ]
+    assert list(islice(binomial.catalan(), 100)) == [
+        math.comb(2*n, n) // (n + 1) for n in range(100)
+    ]
+
+
+def test_pascal():
+    assert sequences.pascal(6) == [1, 6, 15, 20, 15, 6, 1]
+    assert sequences.pascal(50, 10, 20) == [
+        math.comb(50, r) for r in range(10, 20)
+    ]
+    assert sequences.pascal(50, modulus=7) == [
+        math.comb(50, r) % 7 for r in range(51)
+    ]
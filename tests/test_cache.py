@@ -0,0 +1,115 @@
+"""tests of sequences.cache, the term cache"""
+
+
+import threading
+import time
+from itertools import count
+
+import pytest
+
+import sequences
+from sequences.cache import TermCache
+
+
+def naturals():
+    return count(1)
+
+
+def test_hits_misses_and_extensions():
+    cache = TermCache()
+    assert cache.get("n", 5, naturals) == [1, 2, 3, 4, 5]
+    assert cache.get("n", 3, naturals) == [1, 2, 3]
+    assert cache.get("n", 8, naturals) == list(range(1, 9))
+    stats = cache.stats()
+    assert (stats["misses"], stats["hits"], stats["extensions"]) == (1, 1, 1)
+    assert stats["sequences"] == 1 and stats["size"] > 0
+
+
+def test_extension_resumes_the_generator():
+    calls = list()
+
+    def generate():
+        calls.append(None)
+        return count()
+
+    cache = TermCache()
+    for n in range(1, 50):
+        assert cache.get("whole", n, generate) == list(range(n))
+    assert len(calls) == 1
+
+
+def test_returned_lists_are_copies():
+    cache = TermCache()
+    terms = cache.get("n", 3, naturals)
+    terms.append(None)
+    assert cache.get("n", 3, naturals) == [1, 2, 3]
+
+
+def test_least_recently_used_are_evicted():
+    # 100 small ints take about 3600 bytes
+    cache = TermCache(budget=8000)
+    cache.get("a", 100, naturals)
+    cache.get("b", 100, naturals)
+    cache.get("a", 10, naturals)
+    cache.get("c", 100, naturals)
+    assert list(cache.entries) == ["a", "c"]
+    assert cache.stats()["evictions"] == 1
+    assert cache.size <= cache.budget
+    cache.clear()
+    assert cache.stats()["sequences"] == cache.size == 0
+
+
+def test_failing_generator_is_dropped():
+    def failing():
+        yield 1
+        raise RuntimeError ("broken")
+
+    cache = TermCache()
+    with pytest.raises(RuntimeError):
+        cache.get("f", 3, failing)
+    assert "f" not in cache.entries and cache.size == 0
+    assert cache.get("f", 1, failing) == [1]
+
+
+def test_observer():
+    kinds = list()
+    cache = TermCache()
+    cache.observer = kinds.append
+    cache.get("n", 2, naturals)
+    cache.get("n", 2, naturals)
+    cache.get("n", 4, naturals)
+    assert kinds == ["misses", "hits", "extensions"]
+
+
+def test_slow_sequence_does_not_block_the_others():
+    cache, started = TermCache(), threading.Event()
+
+    def slow():
+        started.set()
+        time.sleep(1)
+        yield 0
+
+    cache.get("fast", 10, naturals)
+    thread = threading.Thread(target=cache.get, args=("slow", 1, slow))
+    thread.start()
+    started.wait()
+    start = time.perf_counter()
+    assert cache.get("fast", 10, naturals) == list(range(1, 11))
+    assert time.perf_counter() - start < 0.5
+    thread.join()
+
+
+def test_threads_share_one_prefix():
+    cache, results = TermCache(), list()
+
+    def work():
+        for n in range(1, 300, 7):
+            results.append(cache.get("van_eck", n, sequences.iter_van_eck))
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    expected = sequences.van_eck(300)
+    assert all(terms == expected[:len(terms)] for terms in results)
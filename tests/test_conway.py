@@ -0,0 +1,52 @@
+"""tests of sequences.conway, the look-and-say engine"""
+
+
+import functools
+from itertools import islice
+
+import pytest
+
+import sequences
+from sequences import conway
+
+
+TERMS = 50
+
+SEEDS = [
+    b"1", b"2", b"3", b"7", b"13", b"22", b"312", b"55555",
+]
+
+
+@functools.cache
+def direct(seed: bytes, n: int) -> list[bytes]:
+    """returns the first n terms from seed, describing each term in turn"""
+
+    terms = [seed]
+    while len(terms) < n:
+        terms.append(conway.describe(terms[-1]))
+    return terms
+
+
+def test_describe():
+    assert conway.describe(b"1211") == b"111221"
+    assert conway.describe(b"22") == b"22"
+    assert conway.describe(b"3333333333") == b"103"
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_terms_match_describe(seed):
+    assert list(islice(conway.terms(seed), TERMS)) == direct(seed, TERMS)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_lengths_match_terms(seed):
+    lengths = list(islice(conway.lengths(seed), TERMS))
+    assert lengths == [len(term) for term in direct(seed, TERMS)]
+
+
+def test_look_say():
+    terms = direct(b"1", 20)
+    assert sequences.look_say(20) == [int(term) for term in terms]
+    assert sequences.look_say(20, str) == [term.decode() for term in terms]
+    assert sequences.look_say(20, bytes) == terms
+    assert sequences.look_say_lengths(20) == [len(term) for term in terms]
@@ -0,0 +1,94 @@
+"""tests of sequences.digits: palindromes, undulating numbers, necklaces"""
+
+
+from itertools import product
+
+import pytest
+
+import sequences
+from sequences import digits, nth, rank
+
+
+LIMIT = 10**5
+
+
+def is_undulating(x: int) -> bool:
+    """returns True if x is of the form ABAB... with A ≠ B, and 3+ digits"""
+
+    s = str(x)
+    return len(s) > 2 and s[0] != s[1] and s == (s[:2] * len(s))[: len(s)]
+
+
+def test_palindromes():
+    expected = [x for x in range(LIMIT) if str(x) == str(x)[::-1]]
+    assert sequences.palindrome(len(expected)) == expected
+
+
+def test_undulatings():
+    expected = [x for x in range(10**6) if is_undulating(x)]
+    assert sequences.undulating(len(expected)) == expected
+
+
+@pytest.mark.parametrize("name", ["palindrome", "undulating"])
+def test_nth_and_rank(name):
+    terms = getattr(sequences, name)(3000)
+    assert [nth(name, k) for k in range(3000)] == terms
+    assert [nth(name, k, 97) for k in range(0, 3000, 13)] == [
+        term % 97 for term in terms[::13]
+    ]
+    for k, term in enumerate(terms):
+        assert rank(name, term) == k
+        assert rank(name, term + 1) == k + 1
+    assert rank(name, 0) == 0
+    assert rank(name, -5) == 0
+
+
+def test_nth_large_index():
+    k = 10**30
+    term = nth("palindrome", k)
+    assert str(term) == str(term)[::-1]
+    assert rank("palindrome", term) == k
+    # 81 undulating numbers of each length from 3 digits on
+    term = nth("undulating", 10**4)
+    assert is_undulating(term) and len(str(term)) == 10**4 // 81 + 3
+    assert rank("undulating", term) == 10**4
+
+
+def test_rank_errors():
+    with pytest.raises(ValueError):
+        rank("prime", 10)
+    with pytest.raises(TypeError):
+        rank("palindrome", 10.0)
+
+def test_necklaces():
+    # the smallest rotation of every class, but the classes of words made of
+    # a repeated block of several characters, which are never prime
+    for length in range(1, 7):
+        expected = list()
+        for word in map("".join, product("1379", repeat=length)):
+            turns = {word[i:] + word[:i] for i in range(length)}
+            if word == min(turns) and (
+                len(turns) == length or len(set(word)) == 1
+            ):
+                expected.append(word)
+        assert list(digits.necklaces(length, "1379")) == expected
+
+
+def test_rotations():
+    assert digits.rotations(1193) == [1193, 1931, 9311, 3119]
+    assert digits.rotations(7) == [7]
+
+
+def test_circular_primes():
+    circular = [
+        x for x in range(2, 10**6)
+        if (x < 10 or set(str(x)) <= set("1379"))
+        and x == min(digits.rotations(x))
+        and all(map(sequences.isprime, digits.rotations(x)))
+    ]
+    assert sequences.circular_prime(19) == circular
+    assert sequences.circular_prime(21, repunits=True)[19:] == [
+        (10**19 - 1) // 9, (10**23 - 1) // 9,
+    ]
+    with pytest.raises(ValueError):
+        sequences.circular_prime(20)
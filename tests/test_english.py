@@ -0,0 +1,43 @@
+"""tests of sequences.english and of the Aronson Sequence built on it"""
+
+
+import pytest
+
+import sequences
+from sequences.english import cardinal, ordinal
+
+
+@pytest.mark.parametrize("n, name", [
+    (0, "zero"), (7, "seven"), (15, "fifteen"), (40, "forty"),
+    (99, "ninetynine"), (100, "onehundred"), (124, "onehundredtwentyfour"),
+    (1000, "onethousand"), (1_002_003, "onemilliontwothousandthree"),
+    (10**21, "onesextillion"),
+])
+def test_cardinal(n, name):
+    assert cardinal(n) == name
+
+
+@pytest.mark.parametrize("n, name", [
+    (0, "zeroth"), (1, "first"), (2, "second"), (3, "third"), (4, "fourth"),
+    (5, "fifth"), (8, "eighth"), (9, "ninth"), (11, "eleventh"),
+    (12, "twelfth"), (20, "twentieth"), (21, "twentyfirst"),
+    (100, "onehundredth"), (101, "onehundredfirst"),
+    (1012, "onethousandtwelfth"), (90_000, "ninetythousandth"),
+    (10**6, "onemillionth"), (10**63, "onevigintillionth"),
+    (10**66, "onethousandvigintillionth"),
+    (10**126, "onevigintillionvigintillionth"),
+])
+def test_ordinal(n, name):
+    assert ordinal(n) == name
+
+
+def test_aronson():
+    assert sequences.aronson(10) == [1, 4, 11, 16, 24, 29, 33, 35, 39, 45]
+
+    # "T is the first, fourth, ...": the sentence is rescanned for every term
+    terms, sentence = list(), "tisthe"
+    while len(terms) < 500:
+        positions = [j for j, char in enumerate(sentence, 1) if char == "t"]
+        terms.append(positions[len(terms)])
+        sentence += ordinal(terms[-1])
+    assert sequences.aronson(500) == terms
@@ -0,0 +1,72 @@
+"""tests of sequences.factor"""
+
+
+import math
+import random
+
+import pytest
+
+from sequences.factor import (
+    divisor_count, divisor_sum, factorize, smallest_prime_factor
+)
+from sequences.primality import is_probable_prime
+
+
+def check_factorization(n: int, use_ecm: bool = True) -> None:
+    """asserts that factorize(n) is sorted, prime, and multiplies back to n"""
+
+    factors = factorize(n, use_ecm)
+    assert list(factors) == sorted(factors)
+    assert all(map(is_probable_prime, factors))
+    assert all(e > 0 for e in factors.values())
+    assert math.prod(p**e for p, e in factors.items()) == n
+
+
+def test_small_round_trips():
+    assert factorize(1) == {}
+    for n in range(2, 20_000):
+        check_factorization(n)
+
+
+def test_random_round_trips():
+    generator = random.Random(1821)
+    for _ in range(200):
+        check_factorization(generator.randrange(2, 1 << 64))
+
+
+def test_large_round_trips():
+    for n in (
+        # two 10-digit primes (Pollard-Brent)
+        1_000_000_007 * 9_999_999_967,
+        # a repeated large prime, and a product of Mersenne primes
+        ((1 << 31) - 1) ** 3 * 4096,
+        ((1 << 61) - 1) * ((1 << 31) - 1),
+        # the Fermat number F₇, a product of two primes of 17 and 22 digits
+        (1 << 128) + 1,
+    ):
+        check_factorization(n)
+
+
+def test_round_trips_without_ecm():
+    for n in (2**4 * 3**5 * 65537**2, 1_000_003 * 998_244_353):
+        check_factorization(n, use_ecm=False)
+
+
+def test_smallest_prime_factor():
+    for n in range(2, 5_000):
+        assert smallest_prime_factor(n) == next(iter(factorize(n)))
+    assert smallest_prime_factor(1_000_003 * 998_244_353) == 1_000_003
+
+
+def test_divisor_functions():
+    for n in range(1, 2_000):
+        divisors = [d for d in range(1, n + 1) if not (n % d)]
+        assert divisor_sum(n) == sum(divisors)
+        assert divisor_count(n) == len(divisors)
+
+
+def test_invalid_input():
+    with pytest.raises(TypeError):
+        factorize(2.0)
+    with pytest.raises(ValueError):
+        factorize(0)
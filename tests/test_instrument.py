@@ -0,0 +1,88 @@
+"""tests of sequences.instrument, the opt-in instrumentation"""
+
+
+import threading
+
+import pytest
+
+import sequences
+from sequences import INSTRUMENTS
+from sequences.cache import CACHE
+
+
+@pytest.fixture
+def instruments():
+    CACHE.clear()
+    INSTRUMENTS.reset()
+    INSTRUMENTS.enable()
+    yield INSTRUMENTS
+    INSTRUMENTS.disable()
+    INSTRUMENTS.reset()
+
+
+def test_enable_and_disable():
+    original = sequences.prime
+    INSTRUMENTS.enable()
+    try:
+        assert sequences.prime is not original
+        assert sequences.prime.__wrapped__ is original
+        # the generators do their work after returning, they are left alone
+        assert not hasattr(sequences.iter_prime, "__wrapped__")
+        assert CACHE.observer is not None
+    finally:
+        INSTRUMENTS.disable()
+    assert sequences.prime is original
+    assert CACHE.observer is None
+
+
+def test_counters(instruments):
+    sequences.fibonacci(10)
+    sequences.fibonacci(5)
+    sequences.fibonacci(20)
+    with pytest.raises(ValueError):
+        sequences.fibonacci(0)
+    stats = instruments.stats()["fibonacci"]
+    assert stats["calls"] == 4 and stats["errors"] == 1
+    assert stats["terms"] == 35
+    # a miss, a hit and an extension
+    assert (stats["hits"], stats["misses"]) == (1, 2)
+    assert stats["seconds"] > 0
+
+
+def test_candidates(instruments):
+    terms = sequences.sophie_germain(20)
+    stats = instruments.stats()
+    examined = stats["sophie_germain"]["candidates"]
+    assert examined == stats["isprime"]["candidates"] > 20
+    assert stats["sophie_germain"]["rejected"] == examined - 20
+    # one candidate 2p + 1 for every prime p up to the last term
+    assert examined == len([p for p in sequences.prime(100) if p <= terms[-1]])
+
+
+def test_callbacks(instruments):
+    records = list()
+    instruments.subscribe(records.append)
+    sequences.lucas(3)
+    instruments.unsubscribe(records.append)
+    sequences.lucas(3)
+    assert [record["name"] for record in records] == ["lucas"]
+    assert records[0]["terms"] == 3
+
+
+def test_cache_lookups_of_other_threads_are_not_counted(instruments):
+    stop = threading.Event()
+
+    def noise():
+        while not stop.is_set():
+            sequences.pell(5)
+
+    thread = threading.Thread(target=noise)
+    thread.start()
+    try:
+        for _ in range(50):
+            sequences.tribonacci(10)
+    finally:
+        stop.set()
+        thread.join()
+    stats = instruments.stats()["tribonacci"]
+    assert stats["hits"] + stats["misses"] == 50
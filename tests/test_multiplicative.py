@@ -0,0 +1,54 @@
+"""tests of sequences.multiplicative, the tables of σ, τ, Ω and ω"""
+
+
+import pytest
+
+import sequences
+from sequences import multiplicative
+from sequences.factor import factorize
+from sequences.multiplicative import DivisorTables, linear_sieve
+
+
+N = 5000
+
+
+def brute_force(n: int) -> tuple[int, int, int, int]:
+    """returns σ(n), τ(n), Ω(n) and ω(n) from the factorization of n"""
+
+    divisors = [d for d in range(1, n + 1) if not (n % d)]
+    factors = factorize(n)
+    return sum(divisors), len(divisors), sum(factors.values()), len(factors)
+
+
+def test_linear_sieve():
+    sigma, tau, big, little = linear_sieve(N)
+    for n in range(1, N):
+        assert (sigma[n], tau[n], big[n], little[n]) == brute_force(n)
+
+
+def test_power_sieve():
+    if multiplicative.numpy is None:
+        pytest.skip("NumPy is not installed")
+    for limit in list(range(1, 50)) + [1024, 1025, N, 123457]:
+        assert multiplicative.power_sieve(limit) == linear_sieve(limit)
+
+
+def test_tables_grow():
+    tables = DivisorTables()
+    tables.extend(100)
+    tables.extend(50)
+    assert tables.limit == 100
+    tables.extend(N)
+    assert tables.limit == N
+    assert (tables.sigma, tables.tau) == linear_sieve(N)[:2]
+
+
+def test_sequences():
+    assert sequences.semiprime(10) == [4, 6, 9, 10, 14, 15, 21, 22, 25, 26]
+    assert sequences.sphenic(8) == [30, 42, 66, 70, 78, 102, 105, 110]
+    assert sequences.arithmetic(10) == [1, 3, 5, 6, 7, 11, 13, 14, 15, 17]
+    semiprimes = sequences.semiprime(1000)
+    assert semiprimes == [
+        n for n in range(2, semiprimes[-1] + 1)
+        if sum(factorize(n).values()) == 2
+    ]
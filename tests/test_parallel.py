@@ -0,0 +1,43 @@
+"""tests of sequences.parallel, the parallel range scan behind workers="""
+
+
+import pytest
+
+import sequences
+from sequences.parallel import scan
+
+
+@pytest.mark.parametrize("workers", [1, 2, 3])
+def test_scan_keeps_the_hits_in_order(workers):
+    # small blocks, so that many of them are in flight at once
+    hits = scan(sequences.isprime, 500, 0, workers, chunk=16, max_chunk=64)
+    assert hits == sequences.prime(500)
+
+
+def test_scan_grows_its_blocks():
+    # very few hits: the blocks must grow for the scan to end quickly
+    hits = scan(sequences.is_palindrome, 30, 10**6, 2, chunk=8)
+    below = sequences.rank("palindrome", 10**6)
+    assert hits == sequences.palindrome(below + 30)[below:]
+
+
+def test_scan_start():
+    assert scan(sequences.is_composite, 5, 90, 2, chunk=4) == [
+        90, 91, 92, 93, 94,
+    ]
+
+
+@pytest.mark.parametrize("name, n", [
+    ("composite", 3000), ("sophie_germain", 500), ("arithmetic", 2000),
+    ("perfect", 4), ("circular_prime", 15),
+])
+def test_workers_match_the_sequences(name, n):
+    function = getattr(sequences, name)
+    assert function(n, workers=2) == function(n)
+
+
+def test_workers_are_checked():
+    with pytest.raises(ValueError):
+        sequences.composite(10, workers=0)
+    with pytest.raises(TypeError):
+        sequences.palindrome(10, workers=2.0)
@@ -0,0 +1,84 @@
+"""tests of sequences.primality and of isprime"""
+
+
+import sequences
+from sequences.primality import (
+    is_probable_prime, is_repunit_prime, lucas_lehmer, strong_lucas
+)
+from sequences.sieve import PrimeSieve
+
+
+LIMIT = 10**5
+
+# the strong Lucas pseudoprimes below 10⁵ (OEIS A217255)
+STRONG_LUCAS_PSEUDOPRIMES = [
+    5459, 5777, 10877, 16109, 18971, 22499, 24569, 25199, 40309, 58519,
+    75077, 97439,
+]
+
+
+def primes_below(limit: int) -> set[int]:
+    """returns the primes below limit, by a fresh sieve"""
+
+    sieve = PrimeSieve()
+    sieve.extend(limit)
+    return {p for p in sieve.primes if p < limit}
+
+
+def test_strong_lucas_pseudoprimes():
+    primes = primes_below(LIMIT)
+    found = [
+        n for n in range(5, LIMIT, 2)
+        if n not in primes and strong_lucas(n)
+    ]
+    assert found == STRONG_LUCAS_PSEUDOPRIMES
+
+
+def test_strong_lucas_primes():
+    assert all(strong_lucas(p) for p in primes_below(LIMIT) if p > 2)
+
+
+def test_is_probable_prime_below_limit():
+    primes = primes_below(LIMIT)
+    assert [n for n in range(-10, LIMIT) if is_probable_prime(n)] == sorted(
+        primes
+    )
+
+
+def test_is_probable_prime_strong_pseudoprimes():
+    # strong pseudoprimes to many prime bases, below and above 2⁶⁴
+    for n in (
+        2047, 3215031751, 3825123056546413051, 318665857834031151167461,
+        3317044064679887385961981,
+    ):
+        assert not is_probable_prime(n)
+
+
+def test_is_probable_prime_large():
+    mersenne = [(1 << p) - 1 for p in (61, 89, 107, 127, 521)]
+    assert all(map(is_probable_prime, mersenne))
+    # a Carmichael number, and products of primes above 2⁶⁴
+    assert not is_probable_prime(561 * 1105 * 1729)
+    assert not is_probable_prime(mersenne[2] * mersenne[3])
+    assert not is_probable_prime(mersenne[3] ** 2)
+    assert not is_probable_prime((1 << 67) - 1)
+
+
+def test_isprime_matches_sieve():
+    primes = primes_below(LIMIT)
+    assert all(sequences.isprime(n) == (n in primes) for n in range(LIMIT))
+    assert not sequences.isprime(-7)
+
+
+def test_lucas_lehmer():
+    exponents = [p for p in sorted(primes_below(1300)) if lucas_lehmer(p)]
+    assert exponents == [
+        2, 3, 5, 7, 13, 17, 19, 31, 61, 89, 107, 127, 521, 607, 1279,
+    ]
+
+
+def test_is_repunit_prime():
+    primes = sorted(primes_below(320))
+    assert [p for p in primes if is_repunit_prime(p)] == [
+        2, 19, 23, 317,
+    ]
@@ -0,0 +1,68 @@
+"""tests of sequences.recurrence and of nth for the linear recurrences"""
+
+
+from itertools import islice
+
+import pytest
+
+import sequences
+from sequences import RECURRENCES, nth
+from sequences.recurrence import LinearRecurrence, fast_doubling
+
+
+TERMS = 300
+
+
+@pytest.mark.parametrize("name", sorted(RECURRENCES))
+def test_generators_follow_the_recurrences(name):
+    recurrence = RECURRENCES[name]
+    terms = list(islice(getattr(sequences, f"iter_{name}")(), TERMS))
+    d = len(recurrence.coefficients)
+    assert tuple(terms[:d]) == recurrence.initial
+    for i in range(d, TERMS):
+        assert terms[i] == sum(
+            c * terms[i - j] for j, c in enumerate(recurrence.coefficients, 1)
+        )
+
+
+@pytest.mark.parametrize("name", sorted(RECURRENCES))
+def test_nth_matches_the_sequence(name):
+    terms = getattr(sequences, name)(TERMS)
+    assert [nth(name, k) for k in range(TERMS)] == terms
+    for modulus in (1, 2, 7, 10**9 + 7):
+        assert [nth(name, k, modulus) for k in range(0, TERMS, 7)] == [
+            term % modulus for term in terms[::7]
+        ]
+
+
+def test_fast_doubling():
+    fibs = sequences.fibonacci(200)
+    assert fast_doubling(0) == (1, 0)
+    for k in range(1, 199):
+        assert fast_doubling(k) == (fibs[k - 1], fibs[k])
+        assert fast_doubling(k, 97) == (fibs[k - 1] % 97, fibs[k] % 97)
+
+
+def test_large_index():
+    modulus = 10**9 + 7
+    # the Pisano period of 10 is 60
+    assert nth("fibonacci", 10**18 + 7, 10) == nth("fibonacci", 7, 10)
+    assert nth("lucas", 10**6) == nth("fibonacci", 10**6 - 1) + nth(
+        "fibonacci", 10**6 + 1
+    )
+    assert nth("tribonacci", 10**15, modulus) == LinearRecurrence(
+        (1, 1, 1), (0, 0, 1)
+    ).nth(10**15, modulus)
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        nth("prime", 3)
+    with pytest.raises(TypeError):
+        nth("fibonacci", 3.0)
+    with pytest.raises(ValueError):
+        nth("fibonacci", -1)
+    with pytest.raises(ValueError):
+        nth("fibonacci", 3, 0)
+    with pytest.raises(ValueError):
+        LinearRecurrence((1, 1), (0,))
@@ -0,0 +1,133 @@
+"""tests of sequences.store, the on-disk term store"""
+
+
+import os
+import threading
+
+from sequences.store import HEADER, MAGIC, VERSION, TermStore, pack
+
+
+def test_disabled():
+    store = TermStore()
+    store.write("prime", [2, 3, 5])
+    assert store.count("prime") == 0
+    assert store.read("prime", 3) == []
+    assert store.fetch("prime", 2, lambda n: [2, 3][:n]) == [2, 3]
+
+
+def test_int64_round_trip(tmp_path):
+    store = TermStore(str(tmp_path))
+    terms = [0, 1, -1, 2**63 - 1, -2**63, 12345]
+    store.write("small", terms)
+    data = (tmp_path / "small.seq").read_bytes()
+    assert HEADER.unpack_from(data) == (
+        MAGIC, VERSION, 8, len(terms), 8 * len(terms)
+    )
+    assert len(data) == HEADER.size + 8 * len(terms)
+    assert store.count("small") == len(terms)
+    assert store.read("small", 100) == terms
+    assert store.read("small", 3) == terms[:3]
+
+
+def test_big_round_trip(tmp_path):
+    store = TermStore(str(tmp_path))
+    terms = [0, 2**63, -2**63 - 1, 3**500, -(7**300), 255, -256]
+    store.write("big", terms)
+    data = (tmp_path / "big.seq").read_bytes()
+    assert HEADER.unpack_from(data) == (
+        MAGIC, VERSION, 0, len(terms), len(data) - HEADER.size
+    )
+    assert store.read("big", len(terms)) == terms
+
+
+def test_longer_prefixes_are_appended(tmp_path):
+    store = TermStore(str(tmp_path))
+    path = tmp_path / "squares.seq"
+    store.write("squares", [0, 1, 4])
+    inode = os.stat(path).st_ino
+    for n in range(4, 40):
+        store.write("squares", [k * k for k in range(n)])
+        assert os.stat(path).st_ino == inode
+        assert os.path.getsize(path) == HEADER.size + 8 * n
+    assert store.read("squares", 100) == [k * k for k in range(39)]
+
+    # a term past int64 makes the file switch to length-prefixed terms
+    terms = [k * k for k in range(39)] + [2**64, 5]
+    store.write("squares", terms)
+    assert store.read("squares", 100) == terms
+    store.write("squares", terms + [-1])
+    assert store.read("squares", 100) == terms + [-1]
+    assert os.listdir(tmp_path) == ["squares.seq"]
+
+
+def test_terms_past_the_map_are_not_read(tmp_path):
+    store, other = TermStore(str(tmp_path)), TermStore(str(tmp_path))
+    store.write("cubes", [0, 1, 8])
+    assert other.read("cubes", 10) == [0, 1, 8]
+    # the header now counts terms past the end of other's map
+    store.write("cubes", [k**3 for k in range(10)])
+    assert other.read("cubes", 10) == [0, 1, 8]
+    assert other.fetch("cubes", 10, None) == [k**3 for k in range(10)]
+
+
+def test_fetch_computes_once(tmp_path):
+    calls = list()
+
+    def compute(n):
+        calls.append(n)
+        return [k * k for k in range(n)]
+
+    store = TermStore(str(tmp_path))
+    assert store.fetch("squares", 10, compute) == compute(10)[:10]
+    calls.clear()
+    assert store.fetch("squares", 5, compute) == [0, 1, 4, 9, 16]
+    assert not calls
+
+    # a shorter prefix never replaces a longer one
+    store.write("squares", [0, 1])
+    assert store.count("squares") == 10
+
+    # another store, as another process would, reads the same file
+    assert TermStore(str(tmp_path)).read("squares", 10) == compute(10)
+    assert store.fetch("squares", 12, compute) == compute(12)
+    assert store.count("squares") == 12
+
+
+def test_threads(tmp_path):
+    store, errors = TermStore(str(tmp_path)), list()
+
+    def work(seed):
+        try:
+            # every thread keeps growing the file the others read
+            for i in range(100):
+                n = 1000*i + 100*seed + 1
+                terms = store.fetch("odd", n, lambda n: list(range(1, 2*n, 2)))
+                assert terms == list(range(1, 2*n, 2))
+        except Exception as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=work, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert os.listdir(tmp_path) == ["odd.seq"]
+
+
+def test_foreign_files_are_ignored(tmp_path):
+    store = TermStore(str(tmp_path))
+    (tmp_path / "empty.seq").write_bytes(b"")
+    (tmp_path / "other.seq").write_bytes(
+        HEADER.pack(b"XXXX", VERSION, 8, 1, 8) + pack([1], 8)
+    )
+    (tmp_path / "newer.seq").write_bytes(
+        HEADER.pack(MAGIC, VERSION + 1, 8, 0, 0)
+    )
+    for name in ("empty", "other", "newer", "missing"):
+        assert store.count(name) == 0
+        assert store.read(name, 5) == []
+
+    # and replaced when written to
+    store.write("other", [7, 8])
+    assert store.read("other", 5) == [7, 8]